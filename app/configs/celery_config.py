@@ -1,7 +1,8 @@
 from kombu import Queue
 
 # Accepted serializers and content types
-accept_content = ['json']
+task_serializer = 'orjson'
+accept_content = ['orjson', 'json']
 
 # Celery task configs
 task_track_started = True
@@ -34,7 +35,7 @@ worker_max_tasks_per_child = 1
 # Timeout configurations
 task_soft_time_limit = 3600  # 1 hour soft limit
 task_time_limit = 7200  # 2 hour hard limit
-worker_disable_rate_limits = True
+worker_disable_rate_limits = False
 
 # Task execution settings
 task_acks_late = True
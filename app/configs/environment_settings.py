@@ -10,16 +10,19 @@ available_webhooks = {
             "url": os.environ.get("WEBHOOK_INTEGRATION", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_INTEGRATION_FORMAT", "json"),
         },
         {
             "url": os.environ.get("WEBHOOK_STAGE", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_STAGE_FORMAT", "json"),
         },
         {
             "url": os.environ.get("WEBHOOK_TEST", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_TEST_FORMAT", "json"),
         },
     ],
     "develop": [
@@ -27,16 +30,19 @@ available_webhooks = {
             "url": os.environ.get("WEBHOOK_INTEGRATION", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_INTEGRATION_FORMAT", "json"),
         },
         {
             "url": os.environ.get("WEBHOOK_STAGE", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_STAGE_FORMAT", "json"),
         },
         {
             "url": os.environ.get("WEBHOOK_TEST", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_TEST_FORMAT", "json"),
         },
     ],
     "production": [
@@ -44,6 +50,7 @@ available_webhooks = {
             "url": os.environ.get("WEBHOOK_PROD", ""),
             "username": os.environ.get("WEBHOOK_USERNAME", ""),
             "password": os.environ.get("WEBHOOK_PASSWORD", ""),
+            "format": os.environ.get("WEBHOOK_PROD_FORMAT", "json"),
         }
     ],
 }
@@ -55,6 +62,7 @@ class EnvironmentConfig(BaseModel):
 
 class Settings(BaseSettings):
     celery_broker_url: str = os.environ.get("CELERY_BROKER_URL", "redis://:smucks@redis:6379/0")
+    io_queue_rate_limit: str = os.environ.get("IO_QUEUE_RATE_LIMIT", "60/m")
     _current_environment = EnvironmentConfig(environment=os.environ.get("ENVIRONMENT", "local"))
     webhooks: list = available_webhooks[_current_environment.environment]
 
@@ -1,9 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.web_server.router import router
 import uvicorn
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(router)
 
 
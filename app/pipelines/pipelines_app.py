@@ -5,6 +5,7 @@ import os
 import logging
 import time
 import asyncio
+import threading
 
 from libs.llm_service.gateway import LLMGateway
 from libs.promptStore_service import get_default_langfuse_prompt_manager
@@ -22,6 +23,29 @@ from libs.chunking_service.models import ChunkingConfig, ChunkingMethod
 
 logger = logging.getLogger(__name__)
 
+def _run_on_bridge_thread(coro):
+    """
+    Run a coroutine for a sync caller that is already inside an event loop.
+    
+    Each call gets its own thread and event loop (a plain thread, not a pool), so concurrent
+    callers are not serialized and a sync execute() reached from inside the coroutine cannot
+    deadlock waiting for a busy worker.
+    """
+    outcome = {}
+    
+    def run():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=run, name="pipelines-sync-bridge")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
 
 def get_input_hash(inputs: Dict[str, Any], project_name: str, prompt_config_src: str, pipeline_key: str) -> Tuple[str, str]:
     formatted_input_data = json.dumps(inputs, sort_keys=True)
@@ -727,24 +751,16 @@ class ChunkDocument:
             
             logger.info(f"Created {rag_chunks.chunking_metadata['total_chunks']} chunks for {filename}")
             
-            # Convert DocumentChunk objects to dictionaries for serialization
-            chunks_data = []
-            for chunk in rag_chunks.chunks:
-                chunks_data.append({
+            # Convert DocumentChunk objects to dictionaries for serialization,
+            # inlining the document-level metadata kept once on the result
+            chunks_data = [
+                {
                     "chunk_id": chunk.chunk_id,
                     "text": chunk.text,
-                    "metadata": {
-                        "chunk_index": chunk.metadata.chunk_index,
-                        "chunk_size": chunk.metadata.chunk_size,
-                        "chunk_type": chunk.metadata.chunk_type.value,
-                        "chunking_method": chunk.metadata.chunking_method.value,
-                        "provider": chunk.metadata.provider,
-                        "document_filename": chunk.metadata.document_filename,
-                        "document_size": chunk.metadata.document_size,
-                        "source_document_name": chunk.metadata.source_document_name,
-                        "custom_metadata": chunk.metadata.custom_metadata
-                    }
-                })
+                    "metadata": rag_chunks.get_chunk_metadata(chunk)
+                }
+                for chunk in rag_chunks.chunks
+            ]
             
             return {
                 "chunks": chunks_data,
@@ -926,32 +942,14 @@ class StoreChunksInVectorDB:
     def execute(self) -> Dict[str, Any]:
         """Execute the store chunks operation synchronously"""
 
-        import asyncio
-        
         try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-
-            import concurrent.futures
-            import threading
-            
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(self._execute_async())
-                finally:
-                    new_loop.close()
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                result = future.result()
-                return result
-                
+            asyncio.get_running_loop()
         except RuntimeError:
             # No event loop is running, we can use asyncio.run()
-            result = asyncio.run(self._execute_async())
-            return result
+            return asyncio.run(self._execute_async())
+        
+        # Already inside an event loop: run the coroutine on its own loop in the bridge thread
+        return _run_on_bridge_thread(self._execute_async())
 
     async def _execute_async(self) -> Dict[str, Any]:
         """Store chunks in vector database"""
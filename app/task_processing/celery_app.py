@@ -1,9 +1,11 @@
 import time
+import orjson
 from celery import Celery, signals
 from celery.result import AsyncResult
 from celery.exceptions import Ignore
 from app.configs.environment_settings import settings
 from app.pipelines.pipelines_app import execute_pipeline_step
+from app.utils.serialization import ORJSON_OPTIONS
 from app.utils.webhooks import CallbackTask
 from typing import Dict, Any
 import asyncio
@@ -11,7 +13,7 @@ import copy
 import logging
 import random
 import re
-import time as _time
+from kombu.serialization import register
 try:
     import openai
 except Exception:
@@ -19,6 +21,15 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# orjson-backed serializer for task messages (drop-in replacement for 'json')
+register(
+    'orjson',
+    lambda obj: orjson.dumps(obj, option=ORJSON_OPTIONS),
+    orjson.loads,
+    content_type='application/x-orjson',
+    content_encoding='utf-8',
+)
+
 celery_app = Celery(
     "tasks",
     broker=settings.celery_broker_url,
@@ -27,7 +38,7 @@ celery_app = Celery(
 )
 
 celery_app.config_from_object('app.configs.celery_config')
-celery_app.conf.accept_content = ['application/json', 'application/x-python-serialize']
+celery_app.conf.accept_content = ['application/x-orjson', 'application/json', 'application/x-python-serialize']
 celery_app.conf.update(result_extended=True)
 
 @celery_app.task(name='health_check')
@@ -68,8 +79,7 @@ def wait_for_task(task_id: str, timeout: int = 3600) -> Dict[str, Any]:
         logger.error(f"Prerequisite task {task_id} failed: {result.result}")
         raise result.result
 
-@celery_app.task(bind=True, base=CallbackTask, name='llm_call', serializer='json', soft_time_limit=3600, time_limit=7200)
-def pipeline_call(self, workflow_id: str, step: str, step_input: Dict[str, Any], workflow_output: Dict[str, Any], step_outputs: Dict[str, str]):
+def _execute_pipeline_call(self, workflow_id: str, step: str, step_input: Dict[str, Any], workflow_output: Dict[str, Any], step_outputs: Dict[str, str]):
     logger.info(f"Executing pipeline step: {step} for workflow {workflow_id}")
     inputs = step_input["inputs"]
 
@@ -136,12 +146,6 @@ def pipeline_call(self, workflow_id: str, step: str, step_input: Dict[str, Any],
 
     # Execute the pipeline step sequentially
     try:
-        # Light pacing for io-bound tasks to reduce burst rate limiting
-        if step_input.get("queue") == "io_queue":
-            sleep_s = random.uniform(0.5, 2.0)
-            logger.info(f"Pacing io_queue task by {sleep_s:.2f}s before execution")
-            _time.sleep(sleep_s)
-
         logger.info(f"Executing pipeline step {step} with inputs: {list(inputs.keys())}")
         result = execute_pipeline_step(
             inputs=inputs,
@@ -190,6 +194,22 @@ def pipeline_call(self, workflow_id: str, step: str, step_input: Dict[str, Any],
         raise
 
 
+@celery_app.task(bind=True, base=CallbackTask, name='llm_call', serializer='orjson', soft_time_limit=3600, time_limit=7200)
+def pipeline_call(self, workflow_id: str, step: str, step_input: Dict[str, Any], workflow_output: Dict[str, Any], step_outputs: Dict[str, str]):
+    return _execute_pipeline_call(self, workflow_id, step, step_input, workflow_output, step_outputs)
+
+
+@celery_app.task(bind=True, base=CallbackTask, name='llm_call_io', serializer='orjson', rate_limit=settings.io_queue_rate_limit, soft_time_limit=3600, time_limit=7200)
+def pipeline_call_io(self, workflow_id: str, step: str, step_input: Dict[str, Any], workflow_output: Dict[str, Any], step_outputs: Dict[str, str]):
+    """Same as llm_call, but paced by the worker's rate limiter (used for io_queue)."""
+    return _execute_pipeline_call(self, workflow_id, step, step_input, workflow_output, step_outputs)
+
+
+def get_pipeline_task(queue: str):
+    """Return the pipeline task to enqueue on the given queue."""
+    return pipeline_call_io if queue == 'io_queue' else pipeline_call
+
+
 def process_inputs(inputs):
     """Process inputs to resolve any task IDs to their results."""
     import re
@@ -270,14 +290,13 @@ def process_parallel_tasks(workflow_id: str, step_input: Dict[str, Any], inputs:
         # Ensure subtasks run sequentially (no nested parallel)
         task_input['parallel_task'] = False
 
-        sub_task = pipeline_call.apply_async(
+        # io_queue subtasks are paced by the worker-side rate limit, so enqueue them all at once
+        queue = task_input.get('queue', 'default_queue')
+        sub_task = get_pipeline_task(queue).apply_async(
             args=[workflow_id, step, task_input, workflow_output, step_outputs],
-            queue=task_input.get('queue', 'default_queue')
+            queue=queue
         )
         sub_tasks.append(sub_task)
-        # Stagger io_queue enqueueing slightly to avoid burst RPM spikes
-        if task_input.get('queue') == 'io_queue':
-            _time.sleep(random.uniform(0.05, 0.25))
 
     # Collect results
     for idx, t in enumerate(sub_tasks):
@@ -1,5 +1,5 @@
 from typing import Dict, List
-from app.task_processing.celery_app import celery_app, pipeline_call
+from app.task_processing.celery_app import celery_app, get_pipeline_task, pipeline_call
 from celery.result import AsyncResult
 
 
@@ -91,8 +91,15 @@ def execute_levels(workflow_id, workflow_input, workflow_output, levels, steps_i
         for step in level:
             if step in in_steps:
                 continue
-            queue = "io_queue" if steps_input[step]['parallel_task'] else steps_input[step]['queue']
-            task = pipeline_call.apply_async(
+            if steps_input[step]['parallel_task']:
+                # The parallel step only fans out and waits: run it unthrottled, so it does not
+                # take rate-limit tokens from the io_queue subtasks it dispatches
+                queue = "io_queue"
+                pipeline_task = pipeline_call
+            else:
+                queue = steps_input[step]['queue']
+                pipeline_task = get_pipeline_task(queue)
+            task = pipeline_task.apply_async(
                 args=[workflow_id, step, steps_input[step], outputs, tasks_ids],
                 queue=queue
             )
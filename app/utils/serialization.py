@@ -0,0 +1,5 @@
+import orjson
+
+# orjson options for everything the app serializes (task messages, webhook payloads): like the
+# json module it accepts non-str dict keys, and it also handles numpy values and naive datetimes
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
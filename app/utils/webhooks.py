@@ -1,47 +1,138 @@
 from celery import Task
 import requests
-import json
+import orjson
 from app.configs.environment_settings import settings
+from app.utils.serialization import ORJSON_OPTIONS
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
-def is_json_serializable(obj):
-    """Check if an object is JSON serializable."""
-    try:
-        json.dumps(obj)
-        return True
-    except (TypeError, ValueError):
-        return False
+try:
+    import msgspec
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+except ImportError:
+    _MSGPACK_ENCODER = None
+
+# Shared session so webhook calls reuse pooled connections instead of a new TCP/TLS handshake each time.
+# POSTs are retried on connection errors (nothing was sent) and on 502/503/504 only: read=0 keeps a
+# slow receiver that already got the body from receiving it again. A status retry may still deliver
+# an event twice, which the receiver can detect by (task_id, status). Retry-After is not honoured so
+# that a delivery stays bounded, and after the last retry the 5xx response is returned (and logged).
+_POST_TIMEOUT_SECONDS = 30
+_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_HEADERS = {
+    "json": {"Content-Type": "application/json"},
+    "msgpack": {"Content-Type": "application/msgpack"},
+}
+_MAX_ERROR_MESSAGE_LENGTH = 4096
+# Webhook endpoints are notified concurrently rather than one round-trip after another
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="webhook")
+# Longest a delivery can take: every attempt may use the full connect and read timeouts, plus the
+# backoff before each retry (an upper bound of backoff_factor * 2**n), plus some slack
+_WEBHOOK_TIMEOUT_SECONDS = (
+    (_RETRY.total + 1) * 2 * _POST_TIMEOUT_SECONDS
+    + sum(_RETRY.backoff_factor * 2 ** n for n in range(_RETRY.total))
+    + 5
+)
+
+
+def _webhook_format(webhook):
+    """Wire format for a webhook: "json" (default) or "msgpack" for internal consumers."""
+    fmt = (webhook.get("format") or "json").lower()
+    if fmt == "msgpack" and _MSGPACK_ENCODER is None:
+        logger.warning(f"msgspec not installed, sending JSON to {webhook['url']}")
+        return "json"
+    if fmt not in _HEADERS:
+        logger.warning(f"Unknown webhook format '{fmt}' for {webhook['url']}, using JSON")
+        return "json"
+    return fmt
+
+
+def _encode_payload(payload, fmt):
+    if fmt == "msgpack":
+        return _MSGPACK_ENCODER.encode(payload)
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+def _resolve_webhook(webhook):
+    url = webhook["url"]
+    auth = HTTPBasicAuth(webhook.get("username", ""), webhook.get("password", ""))
+    return url, auth, _webhook_format(webhook)
+
+
+# Webhook settings are static for the process lifetime: resolve (url, auth, format) once
+_WEBHOOKS = tuple(
+    _resolve_webhook(webhook)
+    for webhook in (settings.webhooks or [])
+    if webhook.get("url")
+)
+_WEBHOOK_FORMATS = frozenset(fmt for _, _, fmt in _WEBHOOKS)
+
+
+@lru_cache(maxsize=1024)
+def _is_preprocessing_workflow(workflow_id):
+    """Whether a workflow is a preprocessing one; cached since every step of a workflow asks."""
+    return bool(workflow_id and "preprocessing" in str(workflow_id).casefold())
+
+
+def _first(key, *sources):
+    """Value of key from the first source that has it set (not None); falsy values like "" count."""
+    for source in sources:
+        value = source.get(key)
+        if value is not None:
+            return value
+    return None
+
 
 class CallbackTask(Task):
     @staticmethod
     def send_webhook_notification(payload):
-        logger.info(f"#####################################################")
-        logger.info(f"#####################################################")
-        logger.info(f"#####################################################")
-        logger.info(f"{payload=}")
         """Send webhook notification to configured endpoints."""
-        if not settings.webhooks:
+        logger.debug("payload=%s", payload)
+        if not _WEBHOOKS:
             logger.info("No webhooks configured, skipping notification")
             return payload
-            
-        for webhook in settings.webhooks:
-            if not webhook.get("url"):
-                continue
-                
-            url = webhook["url"] 
-            basic = HTTPBasicAuth(webhook.get("username", ""), webhook.get("password", ""))
-            headers = {"Content-Type": "application/json"}
+
+        # Encode once per wire format in use, not once per endpoint
+        try:
+            bodies = {fmt: _encode_payload(payload, fmt) for fmt in _WEBHOOK_FORMATS}
+        except (TypeError, ValueError) as e:
+            logger.error(f"Webhook payload not serializable, skipping notification: {e}")
+            return None
+
+        futures = {
+            _EXECUTOR.submit(_SESSION.post, url, headers=_HEADERS[fmt], data=bodies[fmt], timeout=_POST_TIMEOUT_SECONDS, auth=basic): url
+            for url, basic, fmt in _WEBHOOKS
+        }
+
+        done, not_done = wait(futures, timeout=_WEBHOOK_TIMEOUT_SECONDS)
+        for future in done:
+            url = futures[future]
             try:
-                response = requests.request(
-                    "POST", url, headers=headers, data=json.dumps(payload), timeout=30, auth=basic
-                )
+                response = future.result()
                 logger.info(f"Webhook notification sent to {url}, status: {response.status_code}")
-                logger.info(f"Webhook response: {response.text}")
+                logger.debug("Webhook response: %s", response.text)
             except Exception as e:
                 logger.error(f"Failed to send webhook notification to {url}: {e}")
+        for future in not_done:
+            logger.error(f"Webhook notification to {futures[future]} did not complete in time")
         return payload
     
     def on_success(self, retval, task_id, args, kwargs):
@@ -52,16 +143,15 @@ class CallbackTask(Task):
             # Fallback to args[2]['inputs'] which contains the original inputs
             step_input = args[2] if len(args) > 2 else {}
             inputs = step_input.get('inputs', {}) if isinstance(step_input, dict) else {}
-            client_id = kwargs.get('client_id') or retval.get('client_id') or inputs.get('client_id')
-            project_id = kwargs.get('project_id') or retval.get('project_id') or inputs.get('project_id')
-            session_id = kwargs.get('session_id') or retval.get('session_id') or inputs.get('session_id')
-            input_text = kwargs.get('input_text') or retval.get('input_text') or inputs.get('input_text')
+            client_id = _first('client_id', kwargs, retval, inputs)
+            project_id = _first('project_id', kwargs, retval, inputs)
+            session_id = _first('session_id', kwargs, retval, inputs)
+            input_text = _first('input_text', kwargs, retval, inputs)
             workflow_id = retval.get('workflow_id') or (args[0] if len(args) > 0 else None)
             
             # Build payload; for preprocessing workflows exclude results
-            is_preprocessing = False
             try:
-                is_preprocessing = bool(workflow_id and "preprocessing" in str(workflow_id).lower())
+                is_preprocessing = _is_preprocessing_workflow(workflow_id)
             except Exception:
                 is_preprocessing = False
 
@@ -79,8 +169,9 @@ class CallbackTask(Task):
                 }
             else:
                 # Build complete payload with ALL fields
-                logger.info(f"####################################\n########################{type(retval['response'])=}")
-                logger.info(f"####################################\n########################{retval['response']=}")
+                response = retval['response']
+                logger.info("Task response type=%s len=%s", type(response).__name__,
+                            len(response) if hasattr(response, '__len__') else None)
 
                 payload = {
                     "workflow_id": workflow_id,
@@ -96,10 +187,8 @@ class CallbackTask(Task):
                     "version": retval.get('version', 'new_version')
                 }
             
-            logger.info(f"✅ SUCCESS webhook payload: {payload}")
-            
-            if is_json_serializable(payload):
-                return self.send_webhook_notification(payload)
+            logger.debug("✅ SUCCESS webhook payload: %s", payload)
+            return self.send_webhook_notification(payload)
     
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """Handle task failure."""
@@ -111,29 +200,29 @@ class CallbackTask(Task):
         if webhook_response:
             # Extract original request data from kwargs
             inputs = step_input.get('inputs', {}) if isinstance(step_input, dict) else {}
-            client_id = kwargs.get('client_id') or inputs.get('client_id')
-            project_id = kwargs.get('project_id') or inputs.get('project_id')
-            session_id = kwargs.get('session_id') or inputs.get('session_id')
-            input_text = kwargs.get('input_text') or inputs.get('input_text')
-            
+            client_id = _first('client_id', kwargs, inputs)
+            project_id = _first('project_id', kwargs, inputs)
+            session_id = _first('session_id', kwargs, inputs)
+            input_text = _first('input_text', kwargs, inputs)
+            # Stringify once and cap the size; chained exceptions can produce huge messages
+            error_message = (str(exc) or exc.__class__.__name__)[:_MAX_ERROR_MESSAGE_LENGTH]
+
             payload = {
                 "workflow_id": workflow_id,
                 "task_id": task_id,
                 "status": "FAILURE",
                 "action": action,
-                "result": str(exc),
-                "result_text": str(exc),
+                "result": error_message,
+                "result_text": error_message,
                 "client_id": client_id,
                 "project_id": project_id,
                 "session_id": session_id,
                 "input_text": input_text,
             }
             
-            logger.info(f"❌ FAILURE webhook payload: {payload}")
-            
-            if is_json_serializable(payload):
-                return self.send_webhook_notification(payload)
-                
+            logger.debug("❌ FAILURE webhook payload: %s", payload)
+            return self.send_webhook_notification(payload)
+
     def update_custom_state(self, task_id, state, info, step_name=None):
         """Update task state with custom information."""
         self.update_state(task_id=task_id, state=state, meta={'info': info, "exc_type": ""})
@@ -1,8 +1,15 @@
-from fastapi import APIRouter, status, Path, Query, HTTPException, Body
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, status, Path, Query, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi import HTTPException
+from functools import lru_cache
 import os
+import traceback
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from app.task_processing.celery_app import celery_app
 from celery.result import AsyncResult
 from app.task_processing.tasks_engine import generate_tasks_structure
@@ -17,74 +24,111 @@ from libs.database_service.sql_db.providers import PgSQLProvider
 
 router = APIRouter()
 
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TEMPLATES_DIR = os.path.join(_BASE_DIR, 'templates')
+
+
+@lru_cache(maxsize=64)
+def _load_template(template_path: str, mtime: float) -> dict:
+    """Parse a workflow template; cached per (path, mtime) so edits on disk are picked up."""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+
+def _request_body_openapi(model, examples) -> dict:
+    """OpenAPI requestBody for endpoints that read the raw JSON body themselves."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": model.model_json_schema(),
+                    "examples": examples,
+                }
+            },
+        }
+    }
+
+
+async def _read_input(request: Request) -> dict:
+    """Return the body's "input" mapping without building a pydantic model for it."""
+    try:
+        data = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Request body must be valid JSON")
+    if not isinstance(data, dict) or not isinstance(data.get("input"), dict):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Request body must contain an 'input' object")
+    return data["input"]
+
+
 @router.get("/health")
 def health():
     task = celery_app.send_task('health_check', args=[])
     result = AsyncResult(task.id, app=celery_app)
-    return JSONResponse({"api": "ok", "celery_task": task.id, "celery_state": result.state})
+    return ORJSONResponse({"api": "ok", "celery_task": task.id, "celery_state": result.state})
 
 @router.get("/api/workflow/{workflow_id}/status")
 def get_workflow_status(workflow_id: str):
     """Get the status of all tasks in a workflow"""
     try:
         # This is a simplified version - in production you'd want to store task IDs in a database
-        return JSONResponse({
+        return ORJSONResponse({
             "workflow_id": workflow_id,
             "message": "Workflow status endpoint - task IDs should be stored in database for full implementation",
             "status": "active"
         })
     except Exception as e:
-        return JSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
 
 @router.post(
     "/api/workflow/{template}",
     summary="Start a workflow",
     description="Start a new workflow using the specified template. The workflow will process documents through the vector preprocessing pipeline.",
     response_description="Returns the workflow ID and task structure for monitoring progress",
-    response_model=WorkflowResponse
+    response_model=WorkflowResponse,
+    openapi_extra=_request_body_openapi(WorkflowRequest, WORKFLOW_REQUEST_EXAMPLES)
 )
-def start_workflow(
-    template: str = Path(..., description="Template name (e.g., 'vector_preprocessing')"),
-    request: WorkflowRequest = Body(..., openapi_examples=WORKFLOW_REQUEST_EXAMPLES)
+async def start_workflow(
+    request: Request,
+    template: str = Path(..., description="Template name (e.g., 'vector_preprocessing')")
 ):
+    workflow_input = await _read_input(request)
     try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        templates_dir = os.path.join(base_dir, 'templates')
-        template_path = os.path.join(templates_dir, f"{template}.yml")
-        if not os.path.exists(template_path):
-            return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        template_path = os.path.join(_TEMPLATES_DIR, f"{template}.yml")
+        try:
+            template_mtime = os.stat(template_path).st_mtime
+        except FileNotFoundError:
+            return ORJSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                                 content={"error": "invalid_template", "details": "Template not found"})
 
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_config = yaml.safe_load(f) or {}
+        template_config = _load_template(template_path, template_mtime)
 
         # Assuming workflow_id is part of the input for now
-        workflow_id = request.input.get("workflow_id", "default_workflow")
+        workflow_id = workflow_input.get("workflow_id", "default_workflow")
 
         # Inject domain_id based on language if provided (expected values: "en", "it", or "fr")
-        language = (request.input.get("language") or "").strip().lower()
+        language = (workflow_input.get("language") or "").strip().lower()
         if language:
             if language == "it":
-                request.input["domain_id"] = "it_dpac"
+                workflow_input["domain_id"] = "it_dpac"
             elif language == "en":
-                request.input["domain_id"] = "en_dpac"
+                workflow_input["domain_id"] = "en_dpac"
             elif language == "fr":
-                request.input["domain_id"] = "fr_dpac"
+                workflow_input["domain_id"] = "fr_dpac"
 
         # Generate tasks structure
-        tasks_structure = generate_tasks_structure(
-            workflow_input={"workflow_id": workflow_id, **request.input},
+        tasks_structure = await run_in_threadpool(
+            generate_tasks_structure,
+            workflow_input={"workflow_id": workflow_id, **workflow_input},
             template_config=template_config
         )
 
-        return WorkflowResponse(
-            workflow_id=workflow_id,
-            tasks=tasks_structure
-        )
+        # tasks_structure is built internally, so skip response_model validation
+        # (response_model is still declared for the OpenAPI schema)
+        return ORJSONResponse({"workflow_id": workflow_id, "tasks": tasks_structure})
     except Exception as e:
-        import traceback
         traceback.print_exc()
-        return JSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
 
 
 
@@ -93,52 +137,52 @@ def start_workflow(
     summary="Start a chat workflow",
     description="Start a new chat workflow using the specified template. The workflow will process user input through the vector inference pipeline.",
     response_description="Returns the workflow ID and task structure for monitoring progress",
-    response_model=WorkflowResponse
+    response_model=WorkflowResponse,
+    openapi_extra=_request_body_openapi(ChatRequest, CHAT_REQUEST_EXAMPLES)
 )
-def start_chat_workflow(
-    template: str = Path(..., description="Template name (e.g., 'vector_inference')"),
-    request: ChatRequest = Body(..., openapi_examples=CHAT_REQUEST_EXAMPLES)
+async def start_chat_workflow(
+    request: Request,
+    template: str = Path(..., description="Template name (e.g., 'vector_inference')")
 ):
+    workflow_input = await _read_input(request)
     try:
         print('################# /api/chat/{template} #################')
-        print(f'{request.input=}')
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        templates_dir = os.path.join(base_dir, 'templates')
-        template_path = os.path.join(templates_dir, f"{template}.yml")
-        if not os.path.exists(template_path):
-            return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        print(f'{workflow_input=}')
+        template_path = os.path.join(_TEMPLATES_DIR, f"{template}.yml")
+        try:
+            template_mtime = os.stat(template_path).st_mtime
+        except FileNotFoundError:
+            return ORJSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                                 content={"error": "invalid_template", "details": "Template not found"})
 
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_config = yaml.safe_load(f) or {}
+        template_config = _load_template(template_path, template_mtime)
 
         # Assuming workflow_id is part of the input for now
-        workflow_id = request.input.get("workflow_id", "default_workflow")
+        workflow_id = workflow_input.get("workflow_id", "default_workflow")
 
         # Inject domain_id based on language if provided (expected values: "en", "it", or "fr")
-        language = (request.input.get("language") or "").strip().lower()
+        language = (workflow_input.get("language") or "").strip().lower()
         if language:
             if language == "it":
-                request.input["domain_id"] = "it_dpac"
+                workflow_input["domain_id"] = "it_dpac"
             elif language == "en":
-                request.input["domain_id"] = "en_dpac"
+                workflow_input["domain_id"] = "en_dpac"
             elif language == "fr":
-                request.input["domain_id"] = "fr_dpac"
+                workflow_input["domain_id"] = "fr_dpac"
 
         # Generate tasks structure
-        tasks_structure = generate_tasks_structure(
-            workflow_input={"workflow_id": workflow_id, **request.input},
+        tasks_structure = await run_in_threadpool(
+            generate_tasks_structure,
+            workflow_input={"workflow_id": workflow_id, **workflow_input},
             template_config=template_config
         )
 
-        return WorkflowResponse(
-            workflow_id=workflow_id,
-            tasks=tasks_structure
-        )
+        # tasks_structure is built internally, so skip response_model validation
+        # (response_model is still declared for the OpenAPI schema)
+        return ORJSONResponse({"workflow_id": workflow_id, "tasks": tasks_structure})
     except Exception as e:
-        import traceback
         traceback.print_exc()
-        return JSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "internal_error", "details": str(e)})
 
 
 
@@ -165,7 +209,9 @@ def get_chat_history(
     project_id: str = Query(..., description="Project ID to filter chat history"),
     session_id: str = Query(..., description="Session ID to filter chat history"),
     client_id: str = Query(None, description="Optional client ID to filter chat history"),
-    user_id: str = Query(None, description="Optional user ID to filter chat history")
+    user_id: str = Query(None, description="Optional user ID to filter chat history"),
+    limit: int = Query(None, ge=1, description="Optional maximum number of messages to return"),
+    offset: int = Query(None, ge=0, description="Optional number of messages to skip (newest first)")
 ):
     """
     Get all chat history for a specific session.
@@ -175,6 +221,8 @@ def get_chat_history(
         session_id: The session identifier
         client_id: Optional client identifier (defaults to project_id if not provided)
         user_id: Optional user identifier to filter messages for a specific user
+        limit: Optional page size; all messages are returned when omitted
+        offset: Optional number of messages to skip, used together with limit
     
     Returns:
         JSON response with all chat history messages and metadata
@@ -189,38 +237,34 @@ def get_chat_history(
             client_id=client_id,
             project_id=project_id,
             session_id=session_id,
-            user_id=user_id
+            user_id=user_id,
+            limit=limit,
+            offset=offset
         )
         
-        # Convert datetime objects to ISO format strings for JSON serialization
-        serialized_messages = []
-        for message in messages:
-            message_dict = dict(message)
-            if 'created_at' in message_dict and hasattr(message_dict['created_at'], 'isoformat'):
-                message_dict['created_at'] = message_dict['created_at'].isoformat()
-            serialized_messages.append(message_dict)
-        
-        return JSONResponse(
+        # orjson serializes datetime values (created_at) to ISO 8601 natively
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
-                "chat_history": serialized_messages,
+                "chat_history": messages,
                 "metadata": {
-                    "total_messages": len(serialized_messages),
+                    "total_messages": len(messages),
                     "client_id": client_id,
                     "project_id": project_id,
                     "session_id": session_id,
-                    "user_id": user_id
+                    "user_id": user_id,
+                    "limit": limit,
+                    "offset": offset
                 }
             }
         )
         
     except Exception as e:
-        import traceback
         error_traceback = traceback.format_exc()
         print(f"Error fetching chat history: {error_traceback}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -232,7 +276,9 @@ def get_chat_history(
                     "client_id": client_id,
                     "project_id": project_id,
                     "session_id": session_id,
-                    "user_id": user_id
+                    "user_id": user_id,
+                    "limit": limit,
+                    "offset": offset
                 }
             }
         )
\ No newline at end of file
@@ -3,10 +3,60 @@
 Configuration Manager for VectorRAG Pipeline
 """
 
+import copy
 import os
+from functools import lru_cache
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a dot-notation key into its path parts and environment variable name"""
+    return tuple(key.split('.')), key.upper().replace('.', '_')
+
+
+class _ReadOnlyDict(dict):
+    """dict that rejects mutation; ConfigManager hands these out so its path index cannot go stale"""
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Configuration is read-only; use ConfigManager.set() to change it")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __deepcopy__(self, memo):
+        # A deep copy is an ordinary, mutable dict
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+    
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def _read_only(value: Any) -> Any:
+    """Read-only copy of the dict structure of a config (other values are shared)"""
+    if isinstance(value, dict):
+        return _ReadOnlyDict((k, _read_only(v)) for k, v in value.items())
+    return value
+
+
+def _flatten(config: Dict[str, Any], prefix: str = "", flat: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Map every dot-notation path (including intermediate sections) to its value"""
+    if flat is None:
+        flat = {}
+    for k, v in config.items():
+        if not isinstance(k, str) or '.' in k:
+            continue
+        path = f"{prefix}{k}"
+        flat[path] = v
+        if isinstance(v, dict):
+            _flatten(v, f"{path}.", flat)
+    return flat
 
 
 class ConfigManager:
@@ -15,8 +65,20 @@ class ConfigManager:
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or "config.yml"
         self._config = {}
-        self.config = {}
+        # Read-only snapshot of _config handed out by config/get, and its dot-path index
+        self._view = _ReadOnlyDict()
+        self._flat = {}
         self.load_config()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Loaded configuration, read-only (change it with set(); copy.deepcopy gives a mutable copy)"""
+        return self._view
+    
+    def _reindex(self):
+        """Rebuild the read-only snapshot and dot-path index after _config changed"""
+        self._view = _read_only(self._config)
+        self._flat = _flatten(self._view)
     
     def load_config(self):
         """Load configuration from YAML file"""
@@ -25,12 +87,10 @@ class ConfigManager:
         if config_file.exists():
             try:
                 with open(config_file, 'r') as f:
-                    self._config = yaml.safe_load(f) or {}
-                    self.config = self._config.copy()
+                    self._config = yaml.load(f, Loader=SafeLoader) or {}
             except Exception as e:
                 print(f"Warning: Could not load {self.config_path}: {e}")
                 self._config = self._get_default_config()
-                self.config = self._config.copy()
         else:
             # Try to load from environment file as fallback
             env_file = Path("local_dev.env")
@@ -38,7 +98,7 @@ class ConfigManager:
                 self._load_env_file(env_file)
             else:
                 self._config = self._get_default_config()
-                self.config = self._config.copy()
+        self._reindex()
     
     def _load_env_file(self, env_file: Path):
         """Load configuration from environment file"""
@@ -65,7 +125,6 @@ class ConfigManager:
             },
             "environment": env_config.get("ENVIRONMENT", "development")
         }
-        self.config = self._config.copy()
     
     def _get_default_config(self):
         """Get default configuration"""
@@ -123,21 +182,15 @@ class ConfigManager:
         }
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value using dot notation"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return os.getenv(key.upper().replace('.', '_'), default)
-        
-        return value
+        """Get configuration value using dot notation (sections are returned read-only)"""
+        try:
+            return self._flat[key]
+        except KeyError:
+            return os.getenv(_split_key(key)[1], default)
     
     def set(self, key: str, value: Any):
         """Set configuration value"""
-        keys = key.split('.')
+        keys = _split_key(key)[0]
         config = self._config
         
         for k in keys[:-1]:
@@ -146,7 +199,7 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
-        self.config = self._config.copy()
+        self._reindex()
     
     def validate_config(self) -> Dict[str, Any]:
         """Validate configuration and return status"""
@@ -3,6 +3,9 @@ Chunking Service Module
 
 This module provides document chunking capabilities for the VectorRAG pipeline.
 """
+import json
+import threading
+from collections import OrderedDict
 
 from .service import ChunkingGeneratorInterface
 from .chunking_generators.token_chunker import TokenChunkerGenerator
@@ -15,26 +18,63 @@ from .models import (
     ChunkingResult,
     DocumentChunk,
     ChunkMetadata,
+    DocumentChunkingContext,
     ChunkType,
     ChunkingRequest,
     ChunkingResponse
 )
 
 
+# Interfaces shared by create_chunking_from_config, by (provider, canonical JSON of the config)
+_MAX_SHARED_INTERFACES = 16
+_SHARED_INTERFACES: "OrderedDict[tuple, ChunkingGeneratorInterface]" = OrderedDict()
+_SHARED_INTERFACES_LOCK = threading.Lock()
+
+
+def _shared_interface(provider: str, config_json: str) -> ChunkingGeneratorInterface:
+    """Shared interface for a provider and config; the least recently used one is closed when evicted"""
+    key = (provider, config_json)
+    with _SHARED_INTERFACES_LOCK:
+        interface = _SHARED_INTERFACES.get(key)
+        if interface is not None:
+            _SHARED_INTERFACES.move_to_end(key)
+            return interface
+        
+        interface = ChunkingGeneratorInterface(
+            default_provider=provider,
+            default_config=ChunkingConfig(**json.loads(config_json))
+        )
+        interface._shared = True
+        _SHARED_INTERFACES[key] = interface
+        evicted = _SHARED_INTERFACES.popitem(last=False)[1] if len(_SHARED_INTERFACES) > _MAX_SHARED_INTERFACES else None
+    if evicted is not None:
+        evicted._close_generators()
+    return interface
+
+
 def create_chunking_from_config(config: dict) -> ChunkingGeneratorInterface:
     """
     Create a chunking adapter from configuration dictionary.
     
+    Interfaces are shared between calls with the same provider and config, so their
+    generators (and loaded tokenizers/chunkers) are reused; close() on a shared interface
+    does nothing. Configs that are not JSON-serializable get a new, unshared interface.
+    
     Args:
-        config: Configuration dictionary with 'provider' and 'config' keys
+        config: Configuration dictionary with 'provider' and 'config' keys.
+            'config' holds ChunkingConfig fields used when a call passes no config.
         
     Returns:
         ChunkingGeneratorInterface instance
     """
     provider = config.get("provider", "token_chunker")
-    chunking_config = ChunkingConfig(**config.get("config", {}))
-    
-    return ChunkingGeneratorInterface(default_provider=provider)
+    settings = config.get("config") or {}
+    # Canonical JSON of the settings is both the cache key and what the config is rebuilt from
+    try:
+        config_json = json.dumps(settings, sort_keys=True)
+    except (TypeError, ValueError):
+        return ChunkingGeneratorInterface(default_provider=provider, default_config=ChunkingConfig(**settings))
+    return _shared_interface(provider, config_json)
 
 __all__ = [
     "ChunkingGeneratorInterface",
@@ -47,6 +87,7 @@ __all__ = [
     "ChunkingResult",
     "DocumentChunk",
     "ChunkMetadata",
+    "DocumentChunkingContext",
     "ChunkType",
     "ChunkingRequest",
     "ChunkingResponse",
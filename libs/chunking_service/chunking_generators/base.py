@@ -2,10 +2,26 @@
 Abstract base classes for chunking generators
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+import asyncio
+import os
+import re
 import time
+import uuid
 
-from ..models import DocumentChunk, ChunkingResult, ChunkingConfig, ChunkMetadata, ChunkType
+import numpy as np
+
+from ..models import DocumentChunk, ChunkingResult, ChunkingConfig, ChunkMetadata, ChunkType, DocumentChunkingContext
+
+# Anchored prefix classifier: one C-level match instead of a chain of Python comparisons.
+# Group names are ChunkType values; headings and list items win over a trailing code fence.
+_CHUNK_PREFIX_RE = re.compile(
+    r"(?P<heading>#)|(?P<list_item>[-*])|(?P<code_block>```)|(?P<quote>>)|(?P<table>\|.*?\|)|(?P<url>https?://|www\.)",
+    re.DOTALL,
+)
+_GROUP_TO_TYPE = {name: ChunkType(name) for name in _CHUNK_PREFIX_RE.groupindex}
+_PREFIX_ONLY_TYPES = frozenset({"heading", "list_item"})
 
 
 class AbstractChunkingGenerator(ABC):
@@ -13,6 +29,7 @@ class AbstractChunkingGenerator(ABC):
     
     def __init__(self, config: ChunkingConfig):
         self.config = config
+        self._config_dump = None
     
     @property
     @abstractmethod
@@ -20,6 +37,14 @@ class AbstractChunkingGenerator(ABC):
         """Return the name of this chunking generator"""
         pass
     
+    @property
+    def config_dump(self) -> Dict[str, Any]:
+        """The config as a dict, dumped once per generator (the config is not changed after init)"""
+        if self._config_dump is None:
+            self._config_dump = self.config.model_dump()
+        # Shallow copy so callers adding keys to one result do not affect the next
+        return dict(self._config_dump)
+    
     @property
     @abstractmethod
     def supports_semantic_chunking(self) -> bool:
@@ -32,6 +57,10 @@ class AbstractChunkingGenerator(ABC):
         """Return whether this generator supports custom separators"""
         pass
     
+    def warm_up(self) -> None:
+        """Load heavy resources (tokenizers, models) ahead of the first request; no-op by default"""
+        pass
+    
     @abstractmethod
     def chunk_text(
         self, 
@@ -52,6 +81,69 @@ class AbstractChunkingGenerator(ABC):
         """
         pass
     
+    async def achunk_text(
+        self,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[DocumentChunk]:
+        """
+        Async wrapper around chunk_text; runs the (blocking) chunker in a worker thread
+        
+        Args:
+            text: Text to chunk
+            document_metadata: Optional metadata about the source document
+            **kwargs: Additional generator-specific parameters
+            
+        Returns:
+            List of document chunks
+        """
+        return await asyncio.to_thread(self.chunk_text, text, document_metadata, **kwargs)
+    
+    async def achunk_text_stream(
+        self,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Async iterator over the chunks of a text, for callers that consume chunks one by one
+        
+        The default implementation chunks the whole text first; generators that can build
+        their DocumentChunks lazily override it.
+        
+        Args:
+            text: Text to chunk
+            document_metadata: Optional metadata about the source document
+            **kwargs: Additional generator-specific parameters
+            
+        Yields:
+            Document chunks in order
+        """
+        for chunk in await self.achunk_text(text, document_metadata, **kwargs):
+            yield chunk
+    
+    async def chunk_document_for_rag(
+        self,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> ChunkingResult:
+        """
+        Chunk a document for RAG (Retrieval-Augmented Generation) - Async version
+        
+        Runs chunk_document_for_rag_sync in a worker thread so the event loop stays free.
+        
+        Args:
+            text: Document text to chunk
+            document_metadata: Optional metadata about the source document
+            **kwargs: Additional parameters
+            
+        Returns:
+            Chunking result with chunks and metadata
+        """
+        return await asyncio.to_thread(self.chunk_document_for_rag_sync, text, document_metadata, **kwargs)
+    
     def chunk_document_for_rag_sync(
         self, 
         text: str,
@@ -71,25 +163,44 @@ class AbstractChunkingGenerator(ABC):
         """
         start_time = time.time()
         
-        # Generate chunks synchronously
-        chunks = self.chunk_text(text, document_metadata, **kwargs)
+        # Document-level metadata is kept once on the result; generators that honour
+        # chunking_context leave it off the individual chunks
+        context = self._create_chunking_context(document_metadata)
+        
+        # Generate chunks synchronously (empty documents never reach the generator)
+        if not text or text.isspace():
+            chunks = []
+        else:
+            chunks = self.chunk_text(text, document_metadata, chunking_context=context, **kwargs)
         
-        # Generate chunk IDs if not provided
+        return self._build_chunking_result(chunks, document_metadata, context, time.time() - start_time)
+    
+    def _build_chunking_result(
+        self,
+        chunks: List[DocumentChunk],
+        document_metadata: Optional[Dict[str, Any]],
+        context: Optional[DocumentChunkingContext],
+        processing_time: float
+    ) -> ChunkingResult:
+        """Assign chunk IDs and wrap the chunks of one document into a ChunkingResult"""
+        # Generate chunk IDs if not provided. The suffix is drawn once per document: unlike the
+        # previous second-resolution timestamp, documents chunked in the same second cannot collide
+        document_key = uuid.uuid4().hex[:16]
         for i, chunk in enumerate(chunks):
             if chunk.chunk_id is None:
-                chunk.chunk_id = f"chunk_{i}_{int(time.time())}"
+                chunk.chunk_id = f"chunk_{i}_{document_key}"
         
-        processing_time = time.time() - start_time
+        average_chunk_size, chunk_size_distribution = self._calculate_chunk_size_stats(chunks)
         
         # Create chunking metadata
         chunking_metadata = {
             "total_chunks": len(chunks),
             "provider": self.name,
             "method": self.config.method.value,
-            "config_used": self.config.model_dump(),
+            "config_used": self.config_dump,
             "processing_timestamp": time.time(),
-            "average_chunk_size": self._calculate_average_chunk_size(chunks),
-            "chunk_size_distribution": self._calculate_chunk_size_distribution(chunks)
+            "average_chunk_size": average_chunk_size,
+            "chunk_size_distribution": chunk_size_distribution
         }
         
         return ChunkingResult(
@@ -100,26 +211,24 @@ class AbstractChunkingGenerator(ABC):
             config_used=self.config,
             processing_time=processing_time,
             document_metadata=document_metadata or {},
-            chunking_metadata=chunking_metadata
+            chunking_metadata=chunking_metadata,
+            context=context
         )
     
-    def _calculate_average_chunk_size(self, chunks: List[DocumentChunk]) -> float:
-        """Calculate average chunk size"""
+    def _calculate_chunk_size_stats(self, chunks: List[DocumentChunk]) -> Tuple[float, Dict[str, int]]:
+        """Calculate average chunk size and chunk size distribution in one pass over the chunks"""
         if not chunks:
-            return 0.0
-        return sum(chunk.get_chunk_length() for chunk in chunks) / len(chunks)
-    
-    def _calculate_chunk_size_distribution(self, chunks: List[DocumentChunk]) -> Dict[str, int]:
-        """Calculate chunk size distribution"""
-        if not chunks:
-            return {}
-        
-        sizes = [chunk.get_chunk_length() for chunk in chunks]
-        return {
-            "min": min(sizes),
-            "max": max(sizes),
-            "mean": int(sum(sizes) / len(sizes)),
-            "median": int(sorted(sizes)[len(sizes) // 2])
+            return 0.0, {}
+        
+        sizes = np.fromiter((chunk.get_chunk_length() for chunk in chunks), dtype=np.int64, count=len(chunks))
+        average = float(sizes.mean())
+        # O(n) selection of the same element sorted(sizes)[n // 2] would return
+        middle = len(sizes) // 2
+        return average, {
+            "min": int(sizes.min()),
+            "max": int(sizes.max()),
+            "mean": int(average),
+            "median": int(np.partition(sizes, middle)[middle])
         }
     
     def _determine_chunk_type(self, chunk_text: str) -> ChunkType:
@@ -129,23 +238,17 @@ class AbstractChunkingGenerator(ABC):
         if not chunk_text:
             return ChunkType.UNKNOWN
         
-        # Check for different content types
-        if chunk_text.startswith('#') or chunk_text.startswith('##'):
-            return ChunkType.HEADING
-        elif chunk_text.startswith('-') or chunk_text.startswith('*'):
-            return ChunkType.LIST_ITEM
-        elif chunk_text.startswith('```') or chunk_text.endswith('```'):
+        match = _CHUNK_PREFIX_RE.match(chunk_text)
+        if match is not None and match.lastgroup in _PREFIX_ONLY_TYPES:
+            return _GROUP_TO_TYPE[match.lastgroup]
+        if chunk_text.endswith('```'):
             return ChunkType.CODE_BLOCK
-        elif chunk_text.startswith('>'):
-            return ChunkType.QUOTE
-        elif chunk_text.startswith('|') and '|' in chunk_text[1:]:
-            return ChunkType.TABLE
-        elif any(chunk_text.startswith(prefix) for prefix in ['http://', 'https://', 'www.']):
-            return ChunkType.URL
-        elif len(chunk_text.split()) <= 3:
+        if match is not None:
+            return _GROUP_TO_TYPE[match.lastgroup]
+        # At most 4 pieces are needed to tell whether there are more than 3 words
+        if len(chunk_text.split(None, 3)) <= 3:
             return ChunkType.SHORT_PHRASE
-        else:
-            return ChunkType.PARAGRAPH
+        return ChunkType.PARAGRAPH
     
     def _create_chunk_metadata(
         self, 
@@ -153,7 +256,12 @@ class AbstractChunkingGenerator(ABC):
         chunk_index: int, 
         document_metadata: Optional[Dict[str, Any]] = None
     ) -> ChunkMetadata:
-        """Create metadata for a chunk"""
+        """
+        Create metadata for a single chunk
+        
+        Convenience helper for one-off chunks; generators building many chunks of one
+        document should resolve the document-level fields once (see _create_chunking_context).
+        """
         return ChunkMetadata(
             chunk_index=chunk_index,
             chunk_size=len(chunk_text),
@@ -166,11 +274,22 @@ class AbstractChunkingGenerator(ABC):
             custom_metadata=document_metadata or {}
         )
     
+    def _create_chunking_context(self, document_metadata: Optional[Dict[str, Any]] = None) -> DocumentChunkingContext:
+        """Create the document-level metadata shared by all chunks of a document"""
+        return DocumentChunkingContext(
+            chunking_method=self.config.method,
+            provider=self.name,
+            document_filename=document_metadata.get("filename") if document_metadata else None,
+            document_size=document_metadata.get("size") if document_metadata else None,
+            source_document_name=document_metadata.get("object_name") if document_metadata else None,
+            custom_metadata=document_metadata or {}
+        )
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check if the chunking service is healthy"""
         try:
             test_text = "This is a test document for chunking. It contains multiple sentences to test the chunking functionality."
-            test_chunks = await self.chunk_text(test_text)
+            test_chunks = await self.achunk_text(test_text)
             
             return {
                 "status": "healthy",
@@ -194,25 +313,96 @@ class AbstractChunkingGenerator(ABC):
 class AbstractBatchChunkingGenerator(AbstractChunkingGenerator):
     """Abstract base class for chunking generators that support batch processing"""
     
-    @abstractmethod
+    @property
+    def prefers_batch_chunking(self) -> bool:
+        """
+        Whether one chunk_texts_batch call beats chunking the documents one by one concurrently
+        
+        True for generators whose batch path does real batched work, e.g. batched tokenization.
+        """
+        return False
+    
+    async def chunk_documents_for_rag_batch(
+        self,
+        texts: List[str],
+        document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> List[ChunkingResult]:
+        """
+        Chunk several documents for RAG with a single chunk_texts_batch call
+        
+        Args:
+            texts: List of document texts to chunk
+            document_metadata_list: Optional list of metadata for each document
+            **kwargs: Additional parameters
+            
+        Returns:
+            One chunking result per input text, in input order; processing_time is the
+            duration of the whole batch
+        """
+        start_time = time.time()
+        metadata_list = [
+            document_metadata_list[i] if document_metadata_list and i < len(document_metadata_list) else None
+            for i in range(len(texts))
+        ]
+        # Same layout as chunk_document_for_rag_sync: document-level metadata on each result's context
+        contexts = [self._create_chunking_context(metadata) for metadata in metadata_list]
+        chunk_lists = await self.chunk_texts_batch(texts, document_metadata_list, chunking_contexts=contexts, **kwargs)
+        processing_time = time.time() - start_time
+        return [
+            self._build_chunking_result(chunks, metadata, context, processing_time)
+            for chunks, metadata, context in zip(chunk_lists, metadata_list, contexts)
+        ]
+    
     async def chunk_texts_batch(
         self, 
         texts: List[str],
         document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        chunking_contexts: Optional[List[Optional[DocumentChunkingContext]]] = None,
         **kwargs
     ) -> List[List[DocumentChunk]]:
         """
         Chunk multiple texts in batch
         
+        The default implementation fans chunk_text out over a thread pool; tokenizer-backed
+        chunkers spend most of their time in native code that releases the GIL.
+        
         Args:
             texts: List of texts to chunk
             document_metadata_list: Optional list of metadata for each document
+            chunking_contexts: Optional document-level context for each text (see chunk_text)
             **kwargs: Additional parameters
             
         Returns:
             List of chunk lists (one per input text)
         """
-        pass
+        return await asyncio.to_thread(self._chunk_texts_threaded, texts, document_metadata_list, chunking_contexts, **kwargs)
+    
+    def _chunk_texts_threaded(
+        self,
+        texts: List[str],
+        document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        chunking_contexts: Optional[List[Optional[DocumentChunkingContext]]] = None,
+        **kwargs
+    ) -> List[List[DocumentChunk]]:
+        """Chunk texts concurrently, preserving input order"""
+        items = [
+            (
+                text,
+                document_metadata_list[i] if document_metadata_list and i < len(document_metadata_list) else None,
+                chunking_contexts[i] if chunking_contexts else None,
+            )
+            for i, text in enumerate(texts)
+        ]
+        if len(texts) <= 1:
+            return [self.chunk_text(text, metadata, chunking_context=context, **kwargs) for text, metadata, context in items]
+        
+        max_workers = self.config.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(
+                lambda item: self.chunk_text(item[0], item[1], chunking_context=item[2], **kwargs),
+                items
+            ))
     
     async def chunk_texts(
         self, 
@@ -5,12 +5,18 @@ This module provides the base class that all Chonkie chunking generators inherit
 including common functionality for tokenizer integration and chunk processing.
 """
 from abc import abstractmethod
-from typing import List, Dict, Any, Optional
+from functools import lru_cache, partial
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
 import logging
+import multiprocessing
+import os
+import weakref
 
-from .base import AbstractChunkingGenerator
+from .base import AbstractBatchChunkingGenerator
 from .tokenizer_utils import get_tokenizer_for_embedding_model
-from ..models import DocumentChunk, ChunkingConfig
+from ..models import DocumentChunk, ChunkMetadata, ChunkingConfig, DocumentChunkingContext
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +27,62 @@ except ImportError:
     CHONKIE_AVAILABLE = False
     logger.warning("Chonkie not available")
 
+# Chunkers shared by live generators whose settings produce the same _chunker_cache_key
+_SHARED_CHUNKERS = weakref.WeakValueDictionary()
 
-class ChonkieChunkingGenerator(AbstractChunkingGenerator):
+
+@lru_cache(maxsize=1)
+def _default_recursive_rules():
+    """Default RecursiveRules, built once per process; chunkers only read their delimiter levels."""
+    from chonkie import RecursiveRules
+    return RecursiveRules()
+
+
+@lru_cache(maxsize=1)
+def _embeddings_http_client():
+    """
+    Process-wide pooled HTTP client for embedding API calls, or None to use the SDK default.
+    
+    Shared by every embeddings client so concurrent chunkers reuse keep-alive connections
+    instead of each client opening its own pool.
+    """
+    try:
+        import httpx
+        from openai import DefaultHttpxClient
+    except ImportError:
+        return None
+    return DefaultHttpxClient(limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+
+
+@lru_cache(maxsize=4)
+def _cached_embedding_model(provider: str, model: str, azure_endpoint: Optional[str] = None, api_key_digest: Optional[str] = None):
+    """Process-wide embedding model per (provider, model, endpoint, key digest); clients are costly to build."""
+    # Import AutoEmbeddings from Chonkie
+    try:
+        from chonkie.embeddings import AutoEmbeddings
+    except ImportError:
+        raise ImportError("Chonkie embeddings not available. Please install chonkie[all]")
+    
+    if provider == "azure_openai":
+        # Try to create Azure OpenAI embeddings instance
+        try:
+            from chonkie.embeddings.azure_openai import AzureOpenAIEmbeddings
+            http_client = _embeddings_http_client()
+            return AzureOpenAIEmbeddings(
+                azure_endpoint=azure_endpoint,
+                model=model,
+                azure_api_key=os.getenv('AZURE_OPENAI_API_KEY'),
+                **({"http_client": http_client} if http_client is not None else {})
+            )
+        except ImportError:
+            # Fallback: use AutoEmbeddings with Azure OpenAI model
+            logger.warning("Azure OpenAI embeddings not available, falling back to AutoEmbeddings")
+            return AutoEmbeddings.get_embeddings(f"azure://{model}")
+    # For other providers, use AutoEmbeddings
+    return AutoEmbeddings.get_embeddings(model)
+
+
+class ChonkieChunkingGenerator(AbstractBatchChunkingGenerator):
     """Base class for all Chonkie-based chunking generators"""
     
     def __init__(self, config: ChunkingConfig):
@@ -44,110 +104,147 @@ class ChonkieChunkingGenerator(AbstractChunkingGenerator):
         """Create the specific chunker with provided parameters. Override in subclasses."""
         pass
     
+    def _get_embedding_target(self) -> Tuple[str, str]:
+        """Embedding (provider, model) this generator tokenizes/embeds for, with defaults applied."""
+        return (
+            self.config.embeddings_provider or "azure_openai",
+            self.config.embeddings_model or "text-embedding-3-large",
+        )
+    
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        """
+        Hashable key identifying the chunker this generator builds, or None to never share it.
+        
+        Override in subclasses with every setting that goes into _get_chunker_params so that
+        generators with identical settings reuse one chunker process-wide.
+        """
+        return None
+    
     def _get_chunker(self):
         """Get or create the chunker instance using strategy-specific parameters."""
-        logger.info(f"🔍 DEBUG: _get_chunker called, current _chunker: {self._chunker}")
+        if self._chunker is not None:
+            return self._chunker
         
-        if self._chunker is None:
-            logger.info("🔍 DEBUG: Creating new chunker instance")
-            params = self._get_chunker_params()
-            logger.info(f"🔍 DEBUG: Chunker parameters: {params}")
-            
+        cache_key = self._chunker_cache_key()
+        chunker = _SHARED_CHUNKERS.get(cache_key) if cache_key is not None else None
+        if chunker is not None:
+            self._chunker = chunker
+            return self._chunker
+        
+        params = self._get_chunker_params()
+        logger.debug("%s: creating chunker with parameters %s", self.name, params)
+        try:
+            self._chunker = self._create_chunker(**params)
+        except Exception as e:
+            logger.error(f"Failed to create chunker for {self.name}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise
+        
+        if cache_key is not None:
             try:
-                self._chunker = self._create_chunker(**params)
-                logger.info(f"🔍 DEBUG: Chunker created successfully: {type(self._chunker)}")
-            except Exception as e:
-                logger.error(f"🔍 DEBUG: Failed to create chunker: {e}")
-                import traceback
-                logger.error(f"🔍 DEBUG: Chunker creation traceback: {traceback.format_exc()}")
-                raise
-        else:
-            logger.info(f"🔍 DEBUG: Using cached chunker: {type(self._chunker)}")
-            
+                _SHARED_CHUNKERS[cache_key] = self._chunker
+            except TypeError:
+                # Chunker type does not support weak references; keep it per-instance
+                pass
         return self._chunker
     
+    def warm_up(self) -> None:
+        """Build the chunker (and with it the tokenizer or embedding model) now."""
+        self._get_chunker()
+    
     def _get_tokenizer(self):
         """Get tokenizer matching the embedding model"""
-        logger.info(f"🔍 DEBUG: _get_tokenizer called, current _tokenizer: {self._tokenizer}")
-        
         if self._tokenizer is None:
-            provider = self.config.embeddings_provider or "azure_openai"
-            model = self.config.embeddings_model or "text-embedding-3-large"
-            
-            logger.info(f"🔍 DEBUG: Getting tokenizer for provider='{provider}', model='{model}'")
-            logger.info(f"🔍 DEBUG: config.embeddings_provider: {self.config.embeddings_provider}")
-            logger.info(f"🔍 DEBUG: config.embeddings_model: {self.config.embeddings_model}")
-            
+            provider, model = self._get_embedding_target()
             self._tokenizer = get_tokenizer_for_embedding_model(provider, model)
-            logger.info(f"🔍 DEBUG: get_tokenizer_for_embedding_model returned: {type(self._tokenizer)} - {self._tokenizer}")
-            
             if self._tokenizer is None:
-                logger.error("🔍 DEBUG: get_tokenizer_for_embedding_model returned None!")
+                logger.error(f"No tokenizer available for provider='{provider}', model='{model}'")
             else:
-                logger.info(f"🔍 DEBUG: Tokenizer retrieved successfully: {type(self._tokenizer)}")
-        else:
-            logger.info(f"🔍 DEBUG: Using cached tokenizer: {type(self._tokenizer)}")
-            
+                logger.debug("%s: using tokenizer %s for %s/%s", self.name, type(self._tokenizer).__name__, provider, model)
         return self._tokenizer
     
     def _build_embedding_model(self):
-        """Build embedding model instance from provider and model config."""
-        provider = self.config.embeddings_provider or "azure_openai"
-        model = self.config.embeddings_model or "text-embedding-3-large"
-        
-        # Import AutoEmbeddings from Chonkie
-        try:
-            from chonkie.embeddings import AutoEmbeddings
-        except ImportError:
-            raise ImportError("Chonkie embeddings not available. Please install chonkie[all]")
+        """Get the process-wide embedding model instance for the provider and model config."""
+        provider, model = self._get_embedding_target()
         
         # For Azure OpenAI, we need to pass the proper parameters
         if provider == "azure_openai":
             # Get Azure OpenAI credentials from environment
-            import os
             azure_endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
             azure_api_key = os.getenv('AZURE_OPENAI_API_KEY')
             
             if not azure_endpoint or not azure_api_key:
                 raise ValueError("Azure OpenAI credentials not found. Please set AZURE_OPENAI_ENDPOINT and AZURE_OPENAI_API_KEY")
             
-            # Try to create Azure OpenAI embeddings instance
-            try:
-                from chonkie.embeddings.azure_openai import AzureOpenAIEmbeddings
-                return AzureOpenAIEmbeddings(
-                    azure_endpoint=azure_endpoint,
-                    model=model,
-                    azure_api_key=azure_api_key
-                )
-            except ImportError:
-                # Fallback: use AutoEmbeddings with Azure OpenAI model
-                logger.warning("Azure OpenAI embeddings not available, falling back to AutoEmbeddings")
-                return AutoEmbeddings.get_embeddings(f"azure://{model}")
+            # Key the cache on a digest so a rotated key gets a new client without keeping the key itself as a cache key
+            api_key_digest = hashlib.blake2b(azure_api_key.encode(), digest_size=8).hexdigest()
+            return _cached_embedding_model(provider, model, azure_endpoint, api_key_digest)
+        return _cached_embedding_model(provider, model)
+    
+    def _iter_document_chunks(
+        self,
+        chonkie_chunks,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        chunking_context: Optional[DocumentChunkingContext] = None
+    ) -> Iterator[DocumentChunk]:
+        """
+        Convert Chonkie chunks of one document into DocumentChunks, one at a time
+        
+        When chunking_context is given, the document-level metadata lives there and
+        each chunk only carries its own index, size and type.
+        """
+        # Document-level fields are resolved once per document and bound into the metadata
+        # constructor, instead of going through _create_chunk_metadata for every chunk.
+        # Every field below is produced here with its declared type, so the models are built
+        # with model_construct and skip pydantic validation in this per-chunk loop
+        if chunking_context is not None:
+            make_metadata = ChunkMetadata.model_construct
         else:
-            # For other providers, use AutoEmbeddings
-            return AutoEmbeddings.get_embeddings(model)
+            make_metadata = partial(ChunkMetadata.model_construct, **dict(self._create_chunking_context(document_metadata)))
+        make_chunk = DocumentChunk.model_construct
+        determine_chunk_type = self._determine_chunk_type
+        
+        # Chonkie chunks carry their text plus start/end offsets into the source text; the
+        # offsets are kept so callers holding the document can address spans without copies
+        for i, chonkie_chunk in enumerate(chonkie_chunks):
+            yield make_chunk(
+                text=chonkie_chunk.text,
+                metadata=make_metadata(
+                    chunk_index=i,
+                    chunk_size=len(chonkie_chunk.text),
+                    chunk_type=determine_chunk_type(chonkie_chunk.text),
+                    start_char=chonkie_chunk.start_index,
+                    end_char=chonkie_chunk.end_index
+                )
+            )
+    
+    def _build_document_chunks(
+        self,
+        chonkie_chunks,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        chunking_context: Optional[DocumentChunkingContext] = None
+    ) -> List[DocumentChunk]:
+        """Convert Chonkie chunks of one document into a list of DocumentChunks"""
+        return list(self._iter_document_chunks(chonkie_chunks, document_metadata, chunking_context))
+    
+    def _chunk_with_chonkie(self, text: str):
+        """Run the Chonkie chunker over one text. Override for strategy-specific execution."""
+        return self._get_chunker().chunk(text)
     
-    def chunk_text(self, text: str, document_metadata: Optional[Dict[str, Any]] = None, **kwargs) -> List[DocumentChunk]:
+    def chunk_text(
+        self,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        chunking_context: Optional[DocumentChunkingContext] = None,
+        **kwargs
+    ) -> List[DocumentChunk]:
         """Chunk text using Chonkie chunker"""
+        # Nothing to chunk: skip chunker/tokenizer setup and the chunker call entirely
+        if not text or text.isspace():
+            return []
+        
         try:
-            chunker = self._get_chunker()
-            chonkie_chunks = chunker.chunk(text)
-            
-            chunks = []
-            for i, chonkie_chunk in enumerate(chonkie_chunks):
-                # Chonkie chunks have a .text attribute
-                chunk_text = chonkie_chunk.text
-                chunk_metadata = self._create_chunk_metadata(
-                    chunk_text=chunk_text,
-                    chunk_index=i,
-                    document_metadata=document_metadata
-                )
-                
-                chunk = DocumentChunk(
-                    text=chunk_text,
-                    metadata=chunk_metadata
-                )
-                chunks.append(chunk)
+            chonkie_chunks = self._chunk_with_chonkie(text)
+            chunks = self._build_document_chunks(chonkie_chunks, document_metadata, chunking_context)
             
             logger.info(f"Text chunked using {self.name}: {len(chunks)} chunks created")
             return chunks
@@ -156,6 +253,92 @@ class ChonkieChunkingGenerator(AbstractChunkingGenerator):
             logger.error(f"Failed to chunk text with {self.name}: {e}", exc_info=True)
             raise RuntimeError(f"Failed to chunk text with {self.name}: {e}") from e
     
+    async def achunk_text_stream(
+        self,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        chunking_context: Optional[DocumentChunkingContext] = None,
+        **kwargs
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Yield the DocumentChunks of a text, each built only when the consumer asks for it
+        
+        The Chonkie chunker runs in a worker thread; no list of DocumentChunks is kept.
+        """
+        if not text or text.isspace():
+            return
+        
+        try:
+            chonkie_chunks = await asyncio.to_thread(self._chunk_with_chonkie, text)
+        except Exception as e:
+            logger.error(f"Failed to chunk text with {self.name}: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to chunk text with {self.name}: {e}") from e
+        
+        for chunk in self._iter_document_chunks(chonkie_chunks, document_metadata, chunking_context):
+            yield chunk
+    
+    async def chunk_texts_batch(
+        self,
+        texts: List[str],
+        document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        chunking_contexts: Optional[List[Optional[DocumentChunkingContext]]] = None,
+        **kwargs
+    ) -> List[List[DocumentChunk]]:
+        """
+        Chunk multiple texts with a single Chonkie chunk_batch call
+        
+        Args:
+            texts: List of texts to chunk
+            document_metadata_list: Optional list of metadata for each document
+            chunking_contexts: Optional document-level context for each text (see chunk_text)
+            **kwargs: Additional parameters
+            
+        Returns:
+            List of chunk lists (one per input text)
+        """
+        return await asyncio.to_thread(
+            self._chunk_texts_with_chonkie_batch, texts, document_metadata_list, chunking_contexts, **kwargs
+        )
+    
+    def _chunk_texts_with_chonkie_batch(
+        self,
+        texts: List[str],
+        document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        chunking_contexts: Optional[List[Optional[DocumentChunkingContext]]] = None,
+        **kwargs
+    ) -> List[List[DocumentChunk]]:
+        """Chunk texts through chunker.chunk_batch, preserving input order"""
+        # Empty and whitespace-only texts produce no chunks and are left out of the batch call
+        indices = [i for i, text in enumerate(texts) if text and not text.isspace()]
+        results: List[List[DocumentChunk]] = [[] for _ in texts]
+        if not indices:
+            return results
+        
+        chunker = self._get_chunker()
+        # Some Chonkie chunkers fan chunk_batch out to a multiprocessing Pool, which a daemonic
+        # process (e.g. a Celery prefork child) is not allowed to create; use threads there instead
+        if getattr(chunker, "_use_multiprocessing", False) and multiprocessing.current_process().daemon:
+            return self._chunk_texts_threaded(texts, document_metadata_list, chunking_contexts, **kwargs)
+        
+        try:
+            batches = self._chunk_batch_with_chonkie(chunker, [texts[i] for i in indices])
+        except Exception as e:
+            logger.error(f"Failed to batch chunk texts with {self.name}: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to batch chunk texts with {self.name}: {e}") from e
+        
+        for i, chonkie_chunks in zip(indices, batches):
+            results[i] = self._build_document_chunks(
+                chonkie_chunks,
+                document_metadata_list[i] if document_metadata_list and i < len(document_metadata_list) else None,
+                chunking_contexts[i] if chunking_contexts else None
+            )
+        logger.info(f"Batch of {len(texts)} texts chunked using {self.name}: {sum(map(len, results))} chunks created")
+        return results
+    
+    def _chunk_batch_with_chonkie(self, chunker, texts: List[str]):
+        """Run the Chonkie chunker's chunk_batch. Override where a chunker's batch API differs."""
+        return chunker.chunk_batch(texts, show_progress=False)
+    
     @property
     def supports_semantic_chunking(self) -> bool:
         return False
@@ -6,8 +6,8 @@ which first chunks text using recursive splitting and then generates
 token-level embeddings for each chunk using sentence-transformers.
 """
 import logging
-from typing import Dict, Any
-from .chonkie_base import ChonkieChunkingGenerator
+from typing import Dict, Any, Optional, Tuple
+from .chonkie_base import ChonkieChunkingGenerator, _default_recursive_rules
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +28,12 @@ class LateChunkerGenerator(ChonkieChunkingGenerator):
     
     def _get_chunker_params(self) -> Dict[str, Any]:
         """Get LateChunker-specific parameters."""
-        from chonkie import RecursiveRules  # Import RecursiveRules
-        
         embedding_model = self._build_embedding_model()
         
         params = {
             "embedding_model": embedding_model,
             "chunk_size": self.config.chunk_size,
-            "rules": RecursiveRules(),  # Required parameter for LateChunker
+            "rules": _default_recursive_rules(),  # Required parameter for LateChunker
         }
         
         # Add optional min_characters_per_chunk if specified
@@ -44,9 +42,13 @@ class LateChunkerGenerator(ChonkieChunkingGenerator):
         
         return params
     
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        # Sharing the chunker also shares its embedding model client
+        return (type(self), *self._get_embedding_target(), self.config.chunk_size, self.config.min_characters_per_chunk)
+    
     def _create_chunker(self, **kwargs):
         """Create LateChunker with its specific parameters."""
-        logger.info(f"Creating LateChunker with parameters: {list(kwargs.keys())}")
+        logger.debug("Creating LateChunker with parameters: %s", list(kwargs))
         
         # LateChunker expects: embedding_model, chunk_size, and optionally min_characters_per_chunk
         # All other params are passed via **kwargs
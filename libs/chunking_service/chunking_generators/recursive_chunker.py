@@ -5,9 +5,10 @@ This generator uses Chonkie's RecursiveChunker for hierarchical text chunking,
 recursively splitting text using different separators while respecting token limits.
 """
 import logging
-from typing import Dict, Any
-from .chonkie_base import ChonkieChunkingGenerator
-from chonkie import RecursiveRules
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from .chonkie_base import ChonkieChunkingGenerator, _default_recursive_rules
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,28 @@ except ImportError:
     RECURSIVE_CHUNKER_AVAILABLE = False
     logger.warning("Chonkie RecursiveChunker not available")
 
+# Documents above this many characters are split into segments that are chunked in parallel
+_PARALLEL_CHUNKING_THRESHOLD = 2_000_000
+# Top-level RecursiveRules delimiter; segments end right after one so no paragraph is cut
+_SEGMENT_SEPARATOR = "\n\n"
+
+
+def _split_into_segments(text: str, segment_count: int) -> List[str]:
+    """Split text into roughly segment_count pieces, each ending on a paragraph break."""
+    target_size = -(-len(text) // segment_count)
+    segments = []
+    start = 0
+    while start < len(text):
+        cut = text.find(_SEGMENT_SEPARATOR, start + target_size)
+        if cut == -1:
+            break
+        cut += len(_SEGMENT_SEPARATOR)
+        segments.append(text[start:cut])
+        start = cut
+    if start < len(text):
+        segments.append(text[start:])
+    return segments
+
 
 class RecursiveChunkerGenerator(ChonkieChunkingGenerator):
     """Recursive chunking using Chonkie RecursiveChunker"""
@@ -26,27 +49,57 @@ class RecursiveChunkerGenerator(ChonkieChunkingGenerator):
     def name(self) -> str:
         return "chonkie_recursive_chunker"
     
+    def _get_min_characters_per_chunk(self) -> int:
+        """min_characters_per_chunk with the RecursiveChunker default applied."""
+        value = getattr(self.config, 'min_characters_per_chunk', None)
+        return 10 if value is None else value
+    
     def _get_chunker_params(self) -> Dict[str, Any]:
-        """Get RecursiveChunker-specific parameters."""        
-        # Define parameter mappings with defaults
-        param_defaults = {
-            'min_characters_per_chunk': 10
-        }
-        
-        # Get parameters with fallback to defaults
-        params = {}
-        for param_name, default_value in param_defaults.items():
-            value = getattr(self.config, param_name, default_value)
-            params[param_name] = default_value if value is None else value
-        
+        """Get RecursiveChunker-specific parameters."""
         return {
             "tokenizer_or_token_counter": self._get_tokenizer(),
             "chunk_size": self.config.chunk_size,
-            "rules": RecursiveRules(),
-            "min_characters_per_chunk": params['min_characters_per_chunk']
+            "rules": _default_recursive_rules(),
+            "min_characters_per_chunk": self._get_min_characters_per_chunk()
         }
     
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        """RecursiveChunkers are shared across generators with the same settings."""
+        return (type(self), *self._get_embedding_target(), self.config.chunk_size, self._get_min_characters_per_chunk())
+    
     def _create_chunker(self, **kwargs):
         """Create RecursiveChunker with its specific parameters."""
-        logger.info(f"🔍 DEBUG: Creating RecursiveChunker with parameters: {kwargs}")
+        logger.debug("Creating RecursiveChunker with parameters: %s", kwargs)
         return RecursiveChunker(**kwargs)
+    
+    def _chunk_with_chonkie(self, text: str):
+        """
+        Run RecursiveChunker over one text
+        
+        Very large documents are first cut into one segment per CPU at paragraph breaks
+        (RecursiveChunker's top-level split), the segments are chunked in threads and the
+        chunks are stitched back together in order with document-relative offsets.
+        """
+        chunker = self._get_chunker()
+        worker_count = self.config.max_workers or os.cpu_count() or 1
+        if len(text) <= _PARALLEL_CHUNKING_THRESHOLD or worker_count < 2:
+            return chunker.chunk(text)
+        
+        segments = _split_into_segments(text, worker_count)
+        with ThreadPoolExecutor(max_workers=min(worker_count, len(segments))) as executor:
+            segment_results = list(executor.map(chunker.chunk, segments))
+        
+        # Segment chunks carry offsets relative to their segment; shift them onto the document
+        chonkie_chunks = []
+        offset = 0
+        for segment, segment_chunks in zip(segments, segment_results):
+            if offset:
+                for chunk in segment_chunks:
+                    if chunk.start_index is not None:
+                        chunk.start_index += offset
+                    if chunk.end_index is not None:
+                        chunk.end_index += offset
+            chonkie_chunks.extend(segment_chunks)
+            offset += len(segment)
+        logger.debug("%s: chunked %d characters in %d segments", self.name, len(text), len(segments))
+        return chonkie_chunks
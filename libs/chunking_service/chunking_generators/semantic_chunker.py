@@ -5,12 +5,87 @@ This generator uses Chonkie's SemanticChunker for semantic similarity-based
 chunking, which splits text based on semantic similarity thresholds using
 sentence-transformers embeddings.
 """
+import hashlib
 import logging
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
 from .chonkie_base import ChonkieChunkingGenerator
 
 logger = logging.getLogger(__name__)
 
+# Sentence/window embeddings reused across documents (repeated headers, footers, templates).
+# Vectors are kept int8-quantized: 8192 vectors of text-embedding-3-large (3072 dims) is about 25 MB.
+_EMBEDDING_CACHE_SIZE = 8192
+_EMBEDDING_CACHE: "OrderedDict[Tuple, Any]" = OrderedDict()
+_EMBEDDING_CACHE_LOCK = threading.Lock()
+# Embeddings classes whose similarity() is plain cosine similarity, which can be computed for all
+# window/sentence pairs at once (others, e.g. SentenceTransformer, delegate to their model)
+_COSINE_SIMILARITY_EMBEDDINGS = frozenset({"AzureOpenAIEmbeddings", "OpenAIEmbeddings", "GeminiEmbeddings"})
+
+
+def _quantize(vector) -> Tuple[float, np.ndarray]:
+    """Symmetric int8 quantization with a per-vector scale; cosine similarity is scale-invariant."""
+    vector = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(vector).max()) / 127 or 1.0
+    return scale, np.rint(vector / scale).astype(np.int8)
+
+
+def _dequantize(entry: Tuple[float, np.ndarray]) -> np.ndarray:
+    scale, quantized = entry
+    return quantized.astype(np.float32) * np.float32(scale)
+
+
+def _embed_with_cache(embedding_model, texts: List[str]) -> Dict[str, Any]:
+    """
+    Embed distinct texts, reusing vectors cached from earlier documents.
+    
+    The cache key is (embeddings class, model, endpoint, sha256 of the text), so a model
+    change never returns stale vectors. Misses are embedded in a single embed_batch call and
+    returned at full precision; cached vectors come back dequantized from int8.
+    """
+    namespace = (type(embedding_model).__name__, getattr(embedding_model, "model", None), getattr(embedding_model, "base_url", None))
+    keys = {text: (namespace, hashlib.sha256(text.encode("utf-8")).digest()) for text in texts}
+    
+    vectors = {}
+    with _EMBEDDING_CACHE_LOCK:
+        for text, key in keys.items():
+            entry = _EMBEDDING_CACHE.get(key)
+            if entry is not None:
+                _EMBEDDING_CACHE.move_to_end(key)
+                vectors[text] = entry
+    vectors = {text: _dequantize(entry) for text, entry in vectors.items()}
+    
+    misses = [text for text in keys if text not in vectors]
+    if misses:
+        embedded = embedding_model.embed_batch(misses)
+        quantized = [_quantize(vector) for vector in embedded]
+        with _EMBEDDING_CACHE_LOCK:
+            for text, vector, entry in zip(misses, embedded, quantized):
+                vectors[text] = vector
+                _EMBEDDING_CACHE[keys[text]] = entry
+            while len(_EMBEDDING_CACHE) > _EMBEDDING_CACHE_SIZE:
+                _EMBEDDING_CACHE.popitem(last=False)
+    return vectors
+
+
+def _pairwise_cosine_similarity(vectors: Dict[str, Any], left: List[str], right: List[str]) -> np.ndarray:
+    """
+    Cosine similarity of the vectors of left[i] and right[i] for every i, as one vectorized pass.
+    
+    Each distinct vector is normalized once; the result is the contiguous float64 array that
+    SemanticChunker's compiled breakpoint search consumes without another conversion.
+    """
+    position = {text: i for i, text in enumerate(vectors)}
+    matrix = np.asarray(list(vectors.values()), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    left_rows = matrix[[position[text] for text in left]]
+    right_rows = matrix[[position[text] for text in right]]
+    return np.einsum("ij,ij->i", left_rows, right_rows).astype(np.float64)
+
 try:
     from chonkie import SemanticChunker
     SEMANTIC_CHUNKER_AVAILABLE = True
@@ -19,6 +94,31 @@ except ImportError:
     logger.warning("Chonkie SemanticChunker not available")
 
 
+if SEMANTIC_CHUNKER_AVAILABLE:
+    class _BatchedSemanticChunker(SemanticChunker):
+        """
+        SemanticChunker that embeds all texts of a document in one embed_batch call.
+        
+        The stock chunker embeds the similarity windows and the sentences in two separate
+        batches, and with the default window of one sentence nearly every text appears in
+        both. Here each distinct text is embedded once, and texts already embedded for an
+        earlier document come from the process-wide embedding cache.
+        """
+        
+        def _get_similarity(self, sentences):
+            window = self.similarity_window
+            window_texts = ["".join(s.text for s in sentences[i:i + window]) for i in range(len(sentences) - window)]
+            sentence_texts = [s.text for s in sentences[window:]]
+            unique_texts = list(dict.fromkeys(window_texts + sentence_texts))
+            if not unique_texts:
+                return []
+            vectors = _embed_with_cache(self.embedding_model, unique_texts)
+            if type(self.embedding_model).__name__ in _COSINE_SIMILARITY_EMBEDDINGS:
+                return _pairwise_cosine_similarity(vectors, window_texts, sentence_texts)
+            similarity = self.embedding_model.similarity
+            return [float(similarity(vectors[w], vectors[t])) for w, t in zip(window_texts, sentence_texts)]
+
+
 class SemanticChunkerGenerator(ChonkieChunkingGenerator):
     """Semantic chunking using Chonkie SemanticChunker"""
     
@@ -57,7 +157,14 @@ class SemanticChunkerGenerator(ChonkieChunkingGenerator):
             "min_sentences_per_chunk": params['min_sentences_per_chunk'],
         }
     
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        # Sharing the chunker also shares its embedding model client
+        return (
+            type(self), *self._get_embedding_target(), self.config.chunk_size, self.config.semantic_threshold,
+            self.config.similarity_window, self.config.min_sentences_per_chunk,
+        )
+    
     def _create_chunker(self, **kwargs):
         """Create SemanticChunker with its specific parameters."""
-        logger.info(f"Creating SemanticChunker with parameters: {list(kwargs.keys())}")
-        return SemanticChunker(**kwargs)
+        logger.debug("Creating SemanticChunker with parameters: %s", list(kwargs))
+        return _BatchedSemanticChunker(**kwargs)
@@ -5,7 +5,7 @@ This generator uses Chonkie's SentenceChunker for sentence-aware text chunking,
 splitting text at sentence boundaries while respecting token limits.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from .chonkie_base import ChonkieChunkingGenerator
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,13 @@ class SentenceChunkerGenerator(ChonkieChunkingGenerator):
             "min_characters_per_sentence": self.config.min_characters_per_sentence if self.config.min_characters_per_sentence is not None else 12
         }
     
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        return (
+            type(self), *self._get_embedding_target(), self.config.chunk_size, self.config.chunk_overlap,
+            self.config.min_sentences_per_chunk, self.config.min_characters_per_sentence,
+        )
+    
     def _create_chunker(self, **kwargs):
         """Create SentenceChunker with its specific parameters."""
-        logger.info(f"🔍 DEBUG: Creating SentenceChunker with parameters: {kwargs}")
+        logger.debug("Creating SentenceChunker with parameters: %s", kwargs)
         return SentenceChunker(**kwargs)
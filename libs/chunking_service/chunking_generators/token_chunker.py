@@ -5,11 +5,15 @@ This generator uses Chonkie's TokenChunker for token-aware text chunking,
 ensuring chunks respect token boundaries and match the embedding model's tokenizer.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .chonkie_base import ChonkieChunkingGenerator
 
 logger = logging.getLogger(__name__)
 
+# Texts tokenized per encode_batch call in batch chunking; tiktoken and HF fast tokenizers
+# encode a batch in parallel native threads without holding the GIL
+_ENCODE_BATCH_SIZE = 32
+
 try:
     from chonkie import TokenChunker
     TOKEN_CHUNKER_AVAILABLE = True
@@ -29,7 +33,7 @@ class TokenChunkerGenerator(ChonkieChunkingGenerator):
         """Get TokenChunker-specific parameters."""
         tokenizer = self._get_tokenizer()
         if tokenizer is None:
-            logger.error("🔍 DEBUG: Tokenizer is None! This will cause the TokenChunker to fail!")
+            logger.error("Tokenizer is None, cannot create TokenChunker")
             raise ValueError("Tokenizer is None - cannot create TokenChunker")
         
         return {
@@ -38,7 +42,19 @@ class TokenChunkerGenerator(ChonkieChunkingGenerator):
             "chunk_overlap": self.config.chunk_overlap  # TokenChunker uses 'chunk_overlap' parameter
         }
     
+    def _chunker_cache_key(self) -> Optional[Tuple]:
+        return (type(self), *self._get_embedding_target(), self.config.chunk_size, self.config.chunk_overlap)
+    
     def _create_chunker(self, **kwargs):
         """Create TokenChunker with its specific parameters."""
-        logger.info(f"🔍 DEBUG: Creating TokenChunker with parameters: {kwargs}")
+        logger.debug("Creating TokenChunker with parameters: %s", kwargs)
         return TokenChunker(**kwargs)
+    
+    @property
+    def prefers_batch_chunking(self) -> bool:
+        # TokenChunker.chunk_batch encodes each batch with one tokenizer encode_batch call
+        return True
+    
+    def _chunk_batch_with_chonkie(self, chunker, texts: List[str]):
+        """TokenChunker.chunk_batch takes batch_size/show_progress_bar instead of show_progress."""
+        return chunker.chunk_batch(texts, batch_size=_ENCODE_BATCH_SIZE, show_progress_bar=False)
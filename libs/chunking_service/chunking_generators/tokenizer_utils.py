@@ -4,18 +4,33 @@ Tokenizer utility functions for Chonkie chunking generators.
 This module provides helper functions to get tokenizers that match embedding models
 using Chonkie's embedding classes with get_tokenizer_or_token_counter().
 """
+import hashlib
 import os
 import logging
-from typing import Optional, Any
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# Tokenizers by (provider, model, endpoint, deployment, api key digest); only successful loads are kept
+_TOKENIZERS: Dict[Tuple, Any] = {}
+_TOKENIZERS_LOCK = threading.Lock()
+
+
+def _key_digest(api_key: Optional[str]) -> Optional[str]:
+    """Short digest of an API key, so cache keys do not hold the key itself."""
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest() if api_key else None
+
+
 def get_tokenizer_for_embedding_model(provider: str, model: str, **kwargs) -> Optional[Any]:
     """
     Get tokenizer that matches the embedding model.
     Uses Chonkie's embedding classes with get_tokenizer_or_token_counter().
     
+    Tokenizers are cached process-wide: building the embeddings client and loading the
+    tiktoken encoding is slow, and every chunker for the same model can share the result.
+    
     Args:
         provider: Embedding provider ("azure_openai", "openai", etc.)
         model: Model name (e.g., "text-embedding-3-large")
@@ -24,85 +39,66 @@ def get_tokenizer_for_embedding_model(provider: str, model: str, **kwargs) -> Op
     Returns:
         Tokenizer instance or None if not available
     """
-    logger.info(f"🔍 DEBUG: get_tokenizer_for_embedding_model called with provider='{provider}', model='{model}'")
-    logger.info(f"🔍 DEBUG: kwargs={kwargs}")
+    if provider == "azure_openai":
+        settings = {
+            "azure_endpoint": kwargs.get("azure_endpoint") or os.getenv("AZURE_OPENAI_ENDPOINT"),
+            "azure_api_key": kwargs.get("azure_api_key") or os.getenv("AZURE_OPENAI_API_KEY"),
+            "deployment": kwargs.get("deployment") or os.getenv("AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT"),
+        }
+        cache_key = (provider, model, settings["azure_endpoint"], settings["deployment"], _key_digest(settings["azure_api_key"]))
+    elif provider == "openai":
+        settings = {"api_key": kwargs.get("api_key") or os.getenv("OPENAI_API_KEY")}
+        cache_key = (provider, model, _key_digest(settings["api_key"]))
+    else:
+        logger.warning(f"Unknown provider {provider}, using default tokenizer")
+        return None
     
+    tokenizer = _TOKENIZERS.get(cache_key)
+    if tokenizer is not None:
+        return tokenizer
+    
+    with _TOKENIZERS_LOCK:
+        tokenizer = _TOKENIZERS.get(cache_key)
+        if tokenizer is None:
+            tokenizer = _load_tokenizer(provider, model, **settings)
+            if tokenizer is not None:
+                _TOKENIZERS[cache_key] = tokenizer
+    return tokenizer
+
+
+def _load_tokenizer(provider: str, model: str, **settings) -> Optional[Any]:
+    """Build the provider's Chonkie embeddings class and take its tokenizer."""
     try:
         if provider == "azure_openai":
-            logger.info("🔍 DEBUG: Processing azure_openai provider")
-            
-            # Check environment variables
-            azure_endpoint = kwargs.get("azure_endpoint") or os.getenv("AZURE_OPENAI_ENDPOINT")
-            azure_api_key = kwargs.get("azure_api_key") or os.getenv("AZURE_OPENAI_API_KEY")
-            deployment = kwargs.get("deployment") or os.getenv("AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT")
-            
-            logger.info(f"🔍 DEBUG: azure_endpoint={azure_endpoint}")
-            logger.info(f"🔍 DEBUG: azure_api_key={'Set' if azure_api_key else 'Not set'}")
-            logger.info(f"🔍 DEBUG: deployment={deployment}")
-            logger.info(f"🔍 DEBUG: model={model}")
-            
-            if not azure_endpoint:
-                logger.error("🔍 DEBUG: azure_endpoint is None or empty")
+            if not settings["azure_endpoint"]:
+                logger.error("AZURE_OPENAI_ENDPOINT is not set, cannot load tokenizer")
                 return None
             
-            if not azure_api_key:
-                logger.error("🔍 DEBUG: azure_api_key is None or empty")
+            if not settings["azure_api_key"]:
+                logger.error("AZURE_OPENAI_API_KEY is not set, cannot load tokenizer")
                 return None
             
-            logger.info("🔍 DEBUG: Importing AzureOpenAIEmbeddings")
             from chonkie.embeddings.azure_openai import AzureOpenAIEmbeddings
-            
-            logger.info("🔍 DEBUG: Creating AzureOpenAIEmbeddings instance")
             embeddings = AzureOpenAIEmbeddings(
-                azure_endpoint=azure_endpoint,
-                azure_api_key=azure_api_key,
+                azure_endpoint=settings["azure_endpoint"],
+                azure_api_key=settings["azure_api_key"],
                 model=model,
-                deployment=deployment
+                deployment=settings["deployment"]
             )
-            logger.info(f"🔍 DEBUG: AzureOpenAIEmbeddings created successfully: {type(embeddings)}")
             
-            logger.info("🔍 DEBUG: Calling get_tokenizer_or_token_counter()")
             tokenizer = embeddings.get_tokenizer_or_token_counter()
-            logger.info(f"🔍 DEBUG: get_tokenizer_or_token_counter() returned: {type(tokenizer)} - {tokenizer}")
-            
             if tokenizer is None:
-                logger.error("🔍 DEBUG: get_tokenizer_or_token_counter() returned None!")
-                # Try alternative methods
-                logger.info("🔍 DEBUG: Trying alternative tokenizer retrieval methods")
-                try:
-                    if hasattr(embeddings, '_tokenizer'):
-                        alt_tokenizer = embeddings._tokenizer
-                        logger.info(f"🔍 DEBUG: _tokenizer attribute: {type(alt_tokenizer)} - {alt_tokenizer}")
-                        if alt_tokenizer is not None:
-                            logger.info("🔍 DEBUG: Using _tokenizer attribute as fallback")
-                            return alt_tokenizer
-                except Exception as e:
-                    logger.error(f"🔍 DEBUG: Failed to access _tokenizer attribute: {e}")
-                
-                logger.error("🔍 DEBUG: All tokenizer retrieval methods failed")
-                return None
-            
-            logger.info(f"🔍 DEBUG: Successfully retrieved tokenizer: {type(tokenizer)}")
+                # Fall back to the attribute the embeddings class keeps the tokenizer in
+                tokenizer = getattr(embeddings, '_tokenizer', None)
+                if tokenizer is None:
+                    logger.error(f"No tokenizer available from AzureOpenAIEmbeddings for model '{model}'")
             return tokenizer
-            
-        elif provider == "openai":
-            logger.info("🔍 DEBUG: Processing openai provider")
-            from chonkie.embeddings.openai import OpenAIEmbeddings
-            embeddings = OpenAIEmbeddings(
-                api_key=kwargs.get("api_key") or os.getenv("OPENAI_API_KEY"),
-                model=model
-            )
-            logger.info("🔍 DEBUG: Calling get_tokenizer_or_token_counter() for OpenAI")
-            tokenizer = embeddings.get_tokenizer_or_token_counter()
-            logger.info(f"🔍 DEBUG: OpenAI tokenizer result: {type(tokenizer)} - {tokenizer}")
-            return tokenizer
-        else:
-            logger.warning(f"🔍 DEBUG: Unknown provider {provider}, using default tokenizer")
-            return None
+        
+        from chonkie.embeddings.openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(api_key=settings["api_key"], model=model)
+        return embeddings.get_tokenizer_or_token_counter()
     except Exception as e:
-        logger.error(f"🔍 DEBUG: Exception in get_tokenizer_for_embedding_model: {e}")
-        import traceback
-        logger.error(f"🔍 DEBUG: Traceback: {traceback.format_exc()}")
+        logger.error(f"Failed to load tokenizer for provider='{provider}', model='{model}': {e}", exc_info=True)
         return None
 
 
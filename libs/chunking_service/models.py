@@ -1,10 +1,15 @@
 """
 Data models for the chunking service
 """
+from collections import Counter
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional, Any, Union, Literal
-from pydantic import BaseModel, Field
+
+import numpy as np
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChunkingMethod(str, Enum):
@@ -36,8 +41,26 @@ class ChunkType(str, Enum):
     UNKNOWN = "unknown"
 
 
+def _freeze(value: Any) -> Any:
+    """Hashable equivalent of a config value (dicts and lists become tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
 class ChunkingConfig(BaseModel):
-    """Configuration for document chunking"""
+    """
+    Configuration for document chunking
+    
+    Configs are immutable and hashable, so they can key generator caches directly;
+    use model_copy(update=...) to derive a modified config.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     chunk_size: int = 1000
     chunk_overlap: int = 200
     method: ChunkingMethod = ChunkingMethod.TOKEN_CHUNKER
@@ -60,6 +83,11 @@ class ChunkingConfig(BaseModel):
     # Additional provider-specific settings
     custom_settings: Dict[str, Any] = Field(default_factory=dict)
     
+    # Thread pool size for batch chunking (defaults to min(32, cpu_count + 4))
+    max_workers: Optional[int] = None
+    # Documents chunked concurrently by ChunkingGeneratorInterface.chunk_texts_batch
+    max_concurrent_documents: int = 5
+    
     # Advanced parameters for specific chunkers
     min_sentences_per_chunk: Optional[int] = None
     min_characters_per_sentence: Optional[int] = None
@@ -75,16 +103,46 @@ class ChunkingConfig(BaseModel):
     filter_window: Optional[int] = 5
     filter_polyorder: Optional[int] = 3
     filter_tolerance: Optional[float] = 0.2
+    
+    @cached_property
+    def _hash_value(self) -> int:
+        # Over every field, consistent with the field-wise __eq__; lists and dicts are frozen to tuples
+        return hash(tuple(_freeze(self.__dict__[name]) for name in type(self).model_fields))
+    
+    def __hash__(self) -> int:
+        # Computed on first use and then read back; the config is frozen so it cannot go stale
+        return self._hash_value
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ChunkingConfig":
+        copied = super().model_copy(update=update, deep=deep)
+        # The copied instance dict carries the cached hash of the original fields
+        copied.__dict__.pop("_hash_value", None)
+        return copied
+
+
+class DocumentChunkingContext(BaseModel):
+    """Document-level metadata shared by every chunk of one ChunkingResult"""
+    chunking_method: ChunkingMethod
+    provider: str
+    document_filename: Optional[str] = None
+    document_size: Optional[int] = None
+    source_document_name: Optional[str] = None
+    custom_metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ChunkMetadata(BaseModel):
-    """Metadata for a document chunk"""
+    """
+    Metadata for a document chunk
+    
+    The document-level fields are left unset when the chunk belongs to a
+    ChunkingResult that stores them once in its context.
+    """
     chunk_index: int
     chunk_size: int
     chunk_type: ChunkType = ChunkType.UNKNOWN
-    chunking_method: ChunkingMethod
+    chunking_method: Optional[ChunkingMethod] = None
     created_at: datetime = Field(default_factory=datetime.now)
-    provider: str
+    provider: Optional[str] = None
     start_char: Optional[int] = None
     end_char: Optional[int] = None
     
@@ -104,8 +162,8 @@ class DocumentChunk(BaseModel):
     metadata: ChunkMetadata
     
     def get_chunk_length(self) -> int:
-        """Get the length of the chunk text"""
-        return len(self.text)
+        """Get the length of the chunk text (recorded in the metadata when the chunk is built)"""
+        return self.metadata.chunk_size
     
     def get_word_count(self) -> int:
         """Get the word count of the chunk"""
@@ -126,37 +184,64 @@ class ChunkingResult(BaseModel):
     processing_time: float
     document_metadata: Dict[str, Any] = Field(default_factory=dict)
     chunking_metadata: Dict[str, Any] = Field(default_factory=dict)
+    # Document-level chunk metadata, stored once instead of on every chunk
+    context: Optional[DocumentChunkingContext] = None
+    
+    def get_chunk_metadata(self, chunk: DocumentChunk) -> Dict[str, Any]:
+        """Full metadata of a chunk as a plain dict, with document-level fields taken from the context"""
+        metadata = chunk.metadata
+        shared = self.context or metadata
+        return {
+            "chunk_index": metadata.chunk_index,
+            "chunk_size": metadata.chunk_size,
+            "chunk_type": metadata.chunk_type.value,
+            "start_char": metadata.start_char,
+            "end_char": metadata.end_char,
+            "chunking_method": shared.chunking_method.value if shared.chunking_method is not None else None,
+            "provider": shared.provider,
+            "document_filename": shared.document_filename,
+            "document_size": shared.document_size,
+            "source_document_name": shared.source_document_name,
+            "custom_metadata": shared.custom_metadata
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the result straight to JSON bytes
+        
+        Goes through pydantic-core's Rust serializer without building an intermediate
+        dict (model_dump) or decoding to str (model_dump_json).
+        """
+        return pydantic_core.to_json(self)
+    
+    def _chunk_sizes(self) -> np.ndarray:
+        """Lengths of all chunk texts as one array"""
+        return np.fromiter((chunk.metadata.chunk_size for chunk in self.chunks), dtype=np.int64, count=len(self.chunks))
     
     def get_average_chunk_size(self) -> float:
         """Get the average chunk size"""
         if not self.chunks:
             return 0.0
-        return sum(chunk.get_chunk_length() for chunk in self.chunks) / len(self.chunks)
+        return float(self._chunk_sizes().mean())
     
     def get_chunk_size_distribution(self) -> Dict[str, int]:
         """Get distribution of chunk sizes"""
         if not self.chunks:
             return {}
         
-        sizes = [chunk.get_chunk_length() for chunk in self.chunks]
+        sizes = self._chunk_sizes()
+        # Upper median (sorted(sizes)[n // 2]) by O(n) selection
+        middle = len(sizes) // 2
         return {
-            "min": min(sizes),
-            "max": max(sizes),
-            "mean": int(sum(sizes) / len(sizes)),
-            "median": int(sorted(sizes)[len(sizes) // 2])
+            "min": int(sizes.min()),
+            "max": int(sizes.max()),
+            "mean": int(sizes.mean()),
+            "median": int(np.partition(sizes, middle)[middle])
         }
     
     def get_chunk_type_distribution(self) -> Dict[str, int]:
         """Get distribution of chunk types"""
-        if not self.chunks:
-            return {}
-        
-        type_counts = {}
-        for chunk in self.chunks:
-            chunk_type = chunk.metadata.chunk_type.value
-            type_counts[chunk_type] = type_counts.get(chunk_type, 0) + 1
-        
-        return type_counts
+        return dict(Counter(chunk.metadata.chunk_type.value for chunk in self.chunks))
 
 
 class ChunkingRequest(BaseModel):
@@ -3,9 +3,15 @@ Chunking Service Interface
 
 This module provides a high-level interface for chunking services.
 """
+import asyncio
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
 
 from .chunking_generators.token_chunker import TokenChunkerGenerator
 from .chunking_generators.sentence_chunker import SentenceChunkerGenerator
@@ -14,10 +20,18 @@ from .chunking_generators.late_chunker import LateChunkerGenerator
 from .chunking_generators.semantic_chunker import SemanticChunkerGenerator
 from .chunking_generators.chonkie_base import CHONKIE_AVAILABLE
 from .chunking_generators.base import AbstractChunkingGenerator
-from .models import ChunkingConfig, ChunkingMethod, ChunkingResult, ChunkingRequest, ChunkingResponse
+from .models import ChunkingConfig, ChunkingMethod, ChunkingResult, ChunkingRequest, ChunkingResponse, DocumentChunk
 
 logger = logging.getLogger(__name__)
 
+_MAX_CACHED_GENERATORS = 64
+# ChunkingConfig is frozen, so every interface without an explicit default can share one instance
+_DEFAULT_CONFIG = ChunkingConfig()
+# Healthy health_check results are reused for this long, so frequent probes do not re-chunk
+_HEALTH_CHECK_TTL_SECONDS = 2.0
+# Providers reported by get_available_providers
+_AVAILABLE_PROVIDERS: Tuple[str, ...] = ("token_chunker", "sentence_chunker", "recursive_chunker")
+
 
 class ChunkingGeneratorInterface:
     """
@@ -27,19 +41,61 @@ class ChunkingGeneratorInterface:
     and handles provider selection, configuration, and fallbacks.
     """
     
-    def __init__(self, default_provider: str = "token_chunker"):
+    def __init__(
+        self,
+        default_provider: str = "token_chunker",
+        default_config: Optional[ChunkingConfig] = None,
+        prewarm: Optional[List[str]] = None
+    ):
         """
         Initialize the chunking service interface
         
         Args:
             default_provider: Default chunking provider to use
+            default_config: Chunking configuration used when a call does not pass one
+            prewarm: Providers whose generators are built with default_config right away
+                (see prewarm()), moving their cold start from the first request to init
         """
         self.default_provider = default_provider
-        self.generators = {}
-        self._initialized = False
+        self.default_config = default_config or _DEFAULT_CONFIG
+        # LRU of generators by (provider, config), bounded by _MAX_CACHED_GENERATORS
+        self.generators: "OrderedDict[Tuple[str, ChunkingConfig], AbstractChunkingGenerator]" = OrderedDict()
+        # (provider, id(config)) -> (config, generator) for config objects already seen; the
+        # entry keeps its config alive, so the id cannot be reused by another object meanwhile.
+        # Entries for a generator are dropped when it is evicted from self.generators
+        self._generators_by_identity: "OrderedDict[Tuple[str, int], Tuple[ChunkingConfig, AbstractChunkingGenerator]]" = OrderedDict()
+        # provider -> (monotonic time, result) of the last healthy health_check
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # get_provider_info results by provider; they depend only on the generator class
+        self._provider_info: Dict[str, Dict[str, Any]] = {}
+        # Cache keys of prewarmed generators, which LRU eviction skips
+        self._pinned: set = set()
+        # (provider, config, generator) of the last get_generator call, read and replaced as one tuple.
+        # It is always the most recently used entry of self.generators, so eviction never drops it
+        self._last_lookup: Optional[Tuple[str, ChunkingConfig, AbstractChunkingGenerator]] = None
+        # Guards the generator caches; lookups by config identity read them without it
+        self._lock = threading.Lock()
+        # Set on interfaces handed out by create_chunking_from_config to several callers: close()
+        # is then a no-op, and the generators are closed when the interface leaves that cache
+        self._shared = False
+        
+        for provider in prewarm or ():
+            try:
+                self.prewarm(provider)
+            except Exception as e:
+                logger.warning(f"Failed to prewarm chunking provider '{provider}': {e}")
         
         logger.info(f"Initialized ChunkingGeneratorInterface with default provider: {default_provider}")
     
+    # Provider name -> factory method; looked up by name so subclasses can override a factory
+    _GENERATOR_FACTORIES: Dict[str, str] = {
+        "token_chunker": "_get_token_chunker_generator",
+        "sentence_chunker": "_get_sentence_chunker_generator",
+        "recursive_chunker": "_get_recursive_chunker_generator",
+        "late_chunker": "_get_late_chunker_generator",
+        "semantic_chunker": "_get_semantic_chunker_generator",
+    }
+    
     def _get_token_chunker_generator(self, config: ChunkingConfig) -> TokenChunkerGenerator:
         """Get token chunker generator"""
         return TokenChunkerGenerator(config)
@@ -71,43 +127,101 @@ class ChunkingGeneratorInterface:
         Returns:
             Chunking generator instance
         """
-        logger.info(f"🔍 DEBUG: ChunkingGeneratorInterface.get_generator called with provider='{provider}'")
-        logger.info(f"🔍 DEBUG: config: {config}")
-        logger.info(f"🔍 DEBUG: config.embeddings_provider: {config.embeddings_provider}")
-        logger.info(f"🔍 DEBUG: config.embeddings_model: {config.embeddings_model}")
-        
-        cache_key = f"{provider}_{hash(str(sorted(config.model_dump().items())))}"
-        logger.info(f"🔍 DEBUG: cache_key: {cache_key}")
-        
-        if cache_key in self.generators:
-            logger.info(f"🔍 DEBUG: Using cached generator for {provider}")
-            return self.generators[cache_key]
+        # Most calls repeat the previous provider and config object
+        last = self._last_lookup
+        if last is not None and last[1] is config and last[0] == provider:
+            return last[2]
         
-        if not CHONKIE_AVAILABLE:
-            logger.error("🔍 DEBUG: Chonkie is not available!")
-            raise ValueError("Chonkie is required but not available. Please install chonkie[all].")
+        # Callers usually pass the same config object again: look it up by identity before
+        # comparing config fields
+        identity_key = (provider, id(config))
+        cache_key = (provider, config)
+        with self._lock:
+            entry = self._generators_by_identity.get(identity_key)
+            if entry is not None and entry[0] is config:
+                # Still marks the generator as used in the LRU (the config hash is cached)
+                self.generators.move_to_end(cache_key)
+                self._generators_by_identity.move_to_end(identity_key)
+                self._last_lookup = (provider, config, entry[1])
+                return entry[1]
+            
+            generator = self.generators.get(cache_key)
+            if generator is not None:
+                self.generators.move_to_end(cache_key)
+                self._remember_config_identity(identity_key, config, generator)
+                return generator
+            
+            if not CHONKIE_AVAILABLE:
+                logger.error("Chonkie is not available")
+                raise ValueError("Chonkie is required but not available. Please install chonkie[all].")
+            
+            factory_name = self._GENERATOR_FACTORIES.get(provider)
+            if factory_name is None:
+                logger.error(f"Unsupported chunking provider: {provider}")
+                raise ValueError(f"Unsupported chunking provider: {provider}")
+            # Cheap: generators build their chunker/tokenizer lazily, outside this lock
+            generator = getattr(self, factory_name)(config)
+            
+            self.generators[cache_key] = generator
+            if len(self.generators) > _MAX_CACHED_GENERATORS:
+                self._evict_least_recently_used()
+            self._remember_config_identity(identity_key, config, generator)
+        logger.debug("Created %s chunking generator %s for config %s", provider, type(generator).__name__, config)
         
-        logger.info(f"🔍 DEBUG: Creating new {provider} generator")
+        return generator
+    
+    def _evict_least_recently_used(self) -> None:
+        """Drop and close the least recently used generator that is not pinned (caller holds _lock)"""
+        for cache_key in self.generators:
+            if cache_key not in self._pinned:
+                evicted = self.generators.pop(cache_key)
+                # The identity and last-lookup caches must not hand out the closed generator
+                for identity_key in [key for key, (_, generator) in self._generators_by_identity.items() if generator is evicted]:
+                    del self._generators_by_identity[identity_key]
+                last = self._last_lookup
+                if last is not None and last[2] is evicted:
+                    self._last_lookup = None
+                # Closing it drops its references to the shared chunker/tokenizer, so those
+                # can be freed once no other generator uses them
+                if hasattr(evicted, 'close'):
+                    evicted.close()
+                return
+    
+    def prewarm(self, provider: str, config: Optional[ChunkingConfig] = None) -> AbstractChunkingGenerator:
+        """
+        Build a generator and its chunker/tokenizer/embedding model now, not on first use
         
-        if provider == "token_chunker":
-            generator = self._get_token_chunker_generator(config)
-        elif provider == "sentence_chunker":
-            generator = self._get_sentence_chunker_generator(config)
-        elif provider == "recursive_chunker":
-            generator = self._get_recursive_chunker_generator(config)
-        elif provider == "late_chunker":
-            generator = self._get_late_chunker_generator(config)
-        elif provider == "semantic_chunker":
-            generator = self._get_semantic_chunker_generator(config)
-        else:
-            logger.error(f"🔍 DEBUG: Unsupported provider: {provider}")
-            raise ValueError(f"Unsupported chunking provider: {provider}")
+        The generator is pinned in the cache: LRU eviction never drops it.
         
-        self.generators[cache_key] = generator
-        logger.info(f"🔍 DEBUG: Created {provider} chunking generator: {type(generator)}")
+        Args:
+            provider: Provider name
+            config: Chunking configuration (uses the interface's default_config if not provided)
+            
+        Returns:
+            The warmed-up generator
+        """
+        if config is None:
+            config = self.default_config
         
+        generator = self.get_generator(provider, config)
+        generator.warm_up()
+        with self._lock:
+            self._pinned.add((provider, config))
         return generator
     
+    def _remember_config_identity(
+        self,
+        identity_key: Tuple[str, int],
+        config: ChunkingConfig,
+        generator: AbstractChunkingGenerator
+    ) -> None:
+        """Record the generator for a config object, bounded by _MAX_CACHED_GENERATORS (caller holds _lock)"""
+        self._last_lookup = (identity_key[0], config, generator)
+        self._generators_by_identity[identity_key] = (config, generator)
+        self._generators_by_identity.move_to_end(identity_key)
+        if len(self._generators_by_identity) > _MAX_CACHED_GENERATORS:
+            self._generators_by_identity.popitem(last=False)
+    
     async def chunk_text(
         self, 
         text: str, 
@@ -121,7 +235,7 @@ class ChunkingGeneratorInterface:
         
         Args:
             text: Text to chunk
-            config: Chunking configuration (uses default if not provided)
+            config: Chunking configuration (uses the interface's default_config if not provided)
             provider: Optional provider override
             document_metadata: Optional metadata about the source document
             **kwargs: Additional configuration
@@ -130,11 +244,47 @@ class ChunkingGeneratorInterface:
             Chunking result with chunks and metadata
         """
         if config is None:
-            config = ChunkingConfig()
+            config = self.default_config
         
         generator = self.get_generator(provider or self.default_provider, config)
         return await generator.chunk_document_for_rag(text, document_metadata, **kwargs)
     
+    async def chunk_text_stream(
+        self,
+        text: str,
+        config: Optional[ChunkingConfig] = None,
+        provider: Optional[str] = None,
+        document_metadata: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Chunk text and yield the chunks one at a time
+        
+        Lets callers embed or store each chunk while later ones are still being built,
+        instead of holding a full ChunkingResult. Chunk IDs follow chunk_document_for_rag.
+        
+        Args:
+            text: Text to chunk
+            config: Chunking configuration (uses the interface's default_config if not provided)
+            provider: Optional provider override
+            document_metadata: Optional metadata about the source document
+            **kwargs: Additional configuration
+            
+        Yields:
+            Document chunks in order
+        """
+        if config is None:
+            config = self.default_config
+        
+        generator = self.get_generator(provider or self.default_provider, config)
+        document_key = uuid.uuid4().hex[:16]
+        i = 0
+        async for chunk in generator.achunk_text_stream(text, document_metadata, **kwargs):
+            if chunk.chunk_id is None:
+                chunk.chunk_id = f"chunk_{i}_{document_key}"
+            i += 1
+            yield chunk
+    
     def chunk_document_for_rag_sync(
         self, 
         text: str,
@@ -165,33 +315,104 @@ class ChunkingGeneratorInterface:
         config: Optional[ChunkingConfig] = None,
         provider: Optional[str] = None,
         document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        return_exceptions: bool = False,
         **kwargs
-    ) -> List[ChunkingResult]:
+    ) -> List[Union[ChunkingResult, BaseException]]:
         """
         Chunk multiple texts in batch
         
+        Documents are chunked concurrently, at most config.max_concurrent_documents at a time.
+        
         Args:
             texts: List of texts to chunk
-            config: Chunking configuration (uses default if not provided)
+            config: Chunking configuration (uses the interface's default_config if not provided)
             provider: Optional provider override
             document_metadata_list: Optional list of metadata for each document
+            return_exceptions: If True, a document that fails gets its exception in place of a
+                result instead of failing the whole batch
             **kwargs: Additional configuration
             
         Returns:
-            List of chunking results
+            List of chunking results, in input order
+        """
+        if config is None:
+            config = self.default_config
+        
+        generator = self.get_generator(provider or self.default_provider, config)
+        # Generators with a real batch path (e.g. batched tokenization) get all texts in one call;
+        # that call fails as a whole, so per-document exceptions need the concurrent path
+        if not return_exceptions and getattr(generator, "prefers_batch_chunking", False):
+            return await generator.chunk_documents_for_rag_batch(texts, document_metadata_list, **kwargs)
+        
+        semaphore = asyncio.Semaphore(max(1, config.max_concurrent_documents))
+        
+        # gather keeps results in input order
+        return await asyncio.gather(*(
+            self._chunk_document_bounded(
+                generator, semaphore, text,
+                document_metadata_list[i] if document_metadata_list and i < len(document_metadata_list) else None,
+                **kwargs
+            )
+            for i, text in enumerate(texts)
+        ), return_exceptions=return_exceptions)
+    
+    async def chunk_texts_stream(
+        self,
+        texts: List[str],
+        config: Optional[ChunkingConfig] = None,
+        provider: Optional[str] = None,
+        document_metadata_list: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> AsyncIterator[Tuple[int, ChunkingResult]]:
+        """
+        Chunk multiple texts, yielding each result as soon as its document is done
+        
+        Unlike chunk_texts_batch, results are not collected into one list, so callers that
+        store each result right away only hold the results they have not consumed yet.
+        Concurrency is bounded by config.max_concurrent_documents as in chunk_texts_batch.
+        
+        Args:
+            texts: List of texts to chunk
+            config: Chunking configuration (uses the interface's default_config if not provided)
+            provider: Optional provider override
+            document_metadata_list: Optional list of metadata for each document
+            **kwargs: Additional configuration
+            
+        Yields:
+            (index into texts, chunking result) pairs, in completion order
         """
         if config is None:
-            config = ChunkingConfig()
+            config = self.default_config
         
         generator = self.get_generator(provider or self.default_provider, config)
+        semaphore = asyncio.Semaphore(max(1, config.max_concurrent_documents))
         
-        results = []
-        for i, text in enumerate(texts):
+        async def chunk_one(i: int, text: str) -> Tuple[int, ChunkingResult]:
             doc_metadata = document_metadata_list[i] if document_metadata_list and i < len(document_metadata_list) else None
-            result = await generator.chunk_document_for_rag(text, doc_metadata, **kwargs)
-            results.append(result)
+            return i, await self._chunk_document_bounded(generator, semaphore, text, doc_metadata, **kwargs)
         
-        return results
+        tasks = [asyncio.ensure_future(chunk_one(i, text)) for i, text in enumerate(texts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early or a document failed: do not leave work running
+            for task in tasks:
+                task.cancel()
+    
+    async def _chunk_document_bounded(
+        self,
+        generator: AbstractChunkingGenerator,
+        semaphore: asyncio.Semaphore,
+        text: str,
+        document_metadata: Optional[Dict[str, Any]],
+        **kwargs
+    ) -> ChunkingResult:
+        """Chunk one document of a batch while holding the batch semaphore"""
+        async with semaphore:
+            # Small jitter so documents released together do not hit embedding APIs in lockstep
+            await asyncio.sleep(random.random() * 0.01)
+            return await generator.chunk_document_for_rag(text, document_metadata, **kwargs)
     
     async def health_check(self, provider: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -203,27 +424,31 @@ class ChunkingGeneratorInterface:
         Returns:
             Health check result
         """
+        provider = provider or self.default_provider
+        cached = self._health_cache.get(provider)
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_CHECK_TTL_SECONDS:
+            return dict(cached[1])
+        
         try:
-            config = ChunkingConfig()
-            generator = self.get_generator(provider or self.default_provider, config)
-            return await generator.health_check()
+            generator = self.get_generator(provider, self.default_config)
+            result = await generator.health_check()
+            # Only healthy results are reused; an unhealthy provider is probed again right away
+            if result.get("status") == "healthy":
+                self._health_cache[provider] = (time.monotonic(), result)
+            else:
+                self._health_cache.pop(provider, None)
+            return dict(result)
         except Exception as e:
+            self._health_cache.pop(provider, None)
             return {
                 "status": "unhealthy",
-                "provider": provider or self.default_provider,
+                "provider": provider,
                 "error": str(e)
             }
     
     def get_available_providers(self) -> List[str]:
         """Get list of available chunking providers"""
-        if not CHONKIE_AVAILABLE:
-            return []
-        
-        return [
-            "token_chunker",
-            "sentence_chunker", 
-            "recursive_chunker"
-        ]
+        return list(_AVAILABLE_PROVIDERS) if CHONKIE_AVAILABLE else []
     
     def get_provider_info(self, provider: str) -> Dict[str, Any]:
         """
@@ -235,17 +460,23 @@ class ChunkingGeneratorInterface:
         Returns:
             Dictionary with provider information
         """
+        info = self._provider_info.get(provider)
+        if info is not None:
+            return dict(info)
+        
         try:
-            config = ChunkingConfig()
-            generator = self.get_generator(provider, config)
+            generator = self.get_generator(provider, self.default_config)
             
-            return {
+            info = {
                 "name": generator.name,
                 "supports_semantic_chunking": generator.supports_semantic_chunking,
                 "supports_custom_separators": generator.supports_custom_separators,
                 "class_name": generator.__class__.__name__,
                 "module": generator.__class__.__module__
             }
+            # Errors are not cached, so a provider that failed (e.g. missing credentials) is retried
+            self._provider_info[provider] = info
+            return dict(info)
         except Exception as e:
             return {
                 "name": provider,
@@ -253,10 +484,30 @@ class ChunkingGeneratorInterface:
             }
     
     def close(self) -> None:
-        """Close all generators and cleanup resources"""
-        for generator in self.generators.values():
+        """
+        Close all generators and cleanup resources
+        
+        Safe to call more than once and while other threads use the interface: the caches
+        are swapped out under the lock, and the detached generators are closed afterwards.
+        Does nothing on a shared interface from create_chunking_from_config, which other
+        callers may still be using.
+        """
+        if self._shared:
+            logger.debug("Not closing shared ChunkingGeneratorInterface; it is closed when evicted from the shared cache")
+            return
+        self._close_generators()
+    
+    def _close_generators(self) -> None:
+        """Detach and close every cached generator"""
+        with self._lock:
+            generators, self.generators = self.generators, OrderedDict()
+            self._last_lookup = None
+            self._generators_by_identity.clear()
+            self._pinned.clear()
+            self._provider_info.clear()
+            self._health_cache.clear()
+        
+        for generator in generators.values():
             if hasattr(generator, 'close'):
                 generator.close()
-        self.generators.clear()
         logger.info("Closed all chunking generators")
-
@@ -7,13 +7,30 @@ with clear error messages and configuration scenarios testing.
 
 import os
 import sys
-from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass
+from collections import Counter, deque
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any, Union
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 import re
 
 
+# Accepted values of the enumerated variables (compared case-insensitively)
+_BOOL_VALUES = frozenset({"true", "false", "1", "0", "yes", "no"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_ENVIRONMENTS = frozenset({"development", "staging", "production", "testing"})
+
+# Variables checked by the Azure OpenAI configuration scenarios
+_MINIMAL_AZURE_VARS = (
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_BASE_URL",
+    "AZURE_OPENAI_CHAT_DEPLOYMENT",
+    "AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT",
+)
+_FULL_AZURE_EXTRA = ("AZURE_OPENAI_API_VERSION",)
+
+
 class ValidationLevel(Enum):
     """Validation severity levels"""
     ERROR = "error"
@@ -21,7 +38,7 @@ class ValidationLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of environment variable validation"""
     level: ValidationLevel
@@ -30,7 +47,7 @@ class ValidationResult:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentVariable:
     """Environment variable definition with validation rules"""
     name: str
@@ -41,16 +58,87 @@ class EnvironmentVariable:
     validation_function: Optional[callable] = None
     depends_on: Optional[List[str]] = None
     group: str = "general"
+    _compiled_pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    # (check, message prefix, suggestion) for every rule that applies, built once per definition
+    _checks: Tuple[Tuple[Callable[[str], Any], str, str], ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        checks = []
+        if self.validation_pattern:
+            # Compiled once here so validation does not go through re's pattern cache on every call
+            self._compiled_pattern = re.compile(self.validation_pattern)
+            checks.append((
+                self._compiled_pattern.match,
+                f"Invalid format for '{self.name}'",
+                f"Value should match pattern: {self.validation_pattern}",
+            ))
+        if self.validation_function:
+            checks.append((
+                self.validation_function,
+                f"Invalid value for '{self.name}'",
+                f"Check the format and valid values for {self.name}",
+            ))
+        self._checks = tuple(checks)
+
+
+def _resolve_validation_order(variables: Mapping[str, EnvironmentVariable]) -> List[EnvironmentVariable]:
+    """
+    Order variable definitions so every variable comes after the ones it depends on
+    
+    Kahn's algorithm over depends_on; independent variables keep their definition order,
+    and dependencies on variables that are not defined are ignored.
+    
+    Raises:
+        ValueError: If depends_on contains a cycle
+    """
+    in_degree = {name: 0 for name in variables}
+    dependents: Dict[str, List[str]] = {name: [] for name in variables}
+    for name, var_def in variables.items():
+        for dependency in var_def.depends_on or ():
+            if dependency in variables:
+                in_degree[name] += 1
+                dependents[dependency].append(name)
+    
+    ready = deque(name for name, degree in in_degree.items() if degree == 0)
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(variables[name])
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+    
+    if len(order) < len(variables):
+        cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+        raise ValueError(f"Circular depends_on between environment variables: {', '.join(cyclic)}")
+    return order
 
 
 class EnvironmentValidator:
     """Comprehensive environment variable validator"""
     
-    def __init__(self):
+    def __init__(self, variables: Optional[Mapping[str, EnvironmentVariable]] = None):
+        """
+        Args:
+            variables: Variable definitions to validate (defaults to the shared module-level table)
+        """
         self.results: List[ValidationResult] = []
-        self.variables = self._define_variables()
-    
-    def _define_variables(self) -> Dict[str, EnvironmentVariable]:
+        # Errors among self.results, counted as validate_all collects them
+        self._error_count = 0
+        if variables is None:
+            self.variables = _VARIABLES
+            self._validation_order = _VALIDATION_ORDER
+        else:
+            self.variables = variables
+            self._validation_order = _resolve_validation_order(variables)
+        # Variables of each group, in validation order
+        self._by_group: Dict[str, List[EnvironmentVariable]] = {}
+        for var_def in self._validation_order:
+            self._by_group.setdefault(var_def.group, []).append(var_def)
+    
+    @classmethod
+    def _define_variables(cls) -> Dict[str, EnvironmentVariable]:
         """Define all environment variables with their validation rules"""
         return {
             # Azure OpenAI Configuration (Primary LLM Provider)
@@ -76,15 +164,15 @@ class EnvironmentValidator:
                 validation_pattern=r"^\d{4}-\d{2}-\d{2}(-preview)?$",
                 group="llm_primary"
             ),
-            "AZURE_OPENAI_LLM": EnvironmentVariable(
-                name="AZURE_OPENAI_LLM",
+            "AZURE_OPENAI_CHAT_DEPLOYMENT": EnvironmentVariable(
+                name="AZURE_OPENAI_CHAT_DEPLOYMENT",
                 required=True,
                 description="Azure OpenAI chat/LLM deployment name",
                 validation_pattern=r"^[a-zA-Z0-9\-_]+$",
                 group="llm_primary"
             ),
-            "AZURE_OPENAI_EMBEDDINGS": EnvironmentVariable(
-                name="AZURE_OPENAI_EMBEDDINGS",
+            "AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT": EnvironmentVariable(
+                name="AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT",
                 required=True,
                 description="Azure OpenAI embeddings model deployment name",
                 validation_pattern=r"^[a-zA-Z0-9\-_]+$",
@@ -168,7 +256,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="8001",
                 description="ChromaDB port",
-                validation_function=self._validate_port,
+                validation_function=cls._validate_port,
                 group="database"
             ),
             
@@ -200,7 +288,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Whether to use HTTPS for MinIO",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="storage"
             ),
             "MINIO_BUCKET": EnvironmentVariable(
@@ -225,7 +313,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="6379",
                 description="Redis port",
-                validation_function=self._validate_port,
+                validation_function=cls._validate_port,
                 group="cache"
             ),
             "REDIS_PASSWORD": EnvironmentVariable(
@@ -239,7 +327,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="0",
                 description="Redis database number",
-                validation_function=self._validate_integer,
+                validation_function=cls._validate_integer,
                 group="cache"
             ),
             
@@ -249,7 +337,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="INFO",
                 description="Logging level",
-                validation_function=self._validate_log_level,
+                validation_function=cls._validate_log_level,
                 group="pipeline"
             ),
             "ENABLE_METRICS": EnvironmentVariable(
@@ -257,7 +345,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="true",
                 description="Enable metrics collection",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="pipeline"
             ),
             "ENABLE_LOGGING": EnvironmentVariable(
@@ -265,7 +353,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="true",
                 description="Enable detailed logging",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="pipeline"
             ),
             "MAX_CONCURRENT_JOBS": EnvironmentVariable(
@@ -273,7 +361,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="5",
                 description="Maximum concurrent pipeline jobs",
-                validation_function=self._validate_positive_integer,
+                validation_function=cls._validate_positive_integer,
                 group="pipeline"
             ),
             "JOB_TIMEOUT_SECONDS": EnvironmentVariable(
@@ -281,7 +369,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="3600",
                 description="Job timeout in seconds",
-                validation_function=self._validate_positive_integer,
+                validation_function=cls._validate_positive_integer,
                 group="pipeline"
             ),
             "RETRY_ATTEMPTS": EnvironmentVariable(
@@ -289,7 +377,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="3",
                 description="Number of retry attempts for failed operations",
-                validation_function=self._validate_positive_integer,
+                validation_function=cls._validate_positive_integer,
                 group="pipeline"
             ),
             "RETRY_DELAY_SECONDS": EnvironmentVariable(
@@ -297,7 +385,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="30",
                 description="Delay between retry attempts in seconds",
-                validation_function=self._validate_positive_integer,
+                validation_function=cls._validate_positive_integer,
                 group="pipeline"
             ),
             
@@ -307,7 +395,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="development",
                 description="Application environment",
-                validation_function=self._validate_environment,
+                validation_function=cls._validate_environment,
                 group="general"
             ),
             "DEBUG": EnvironmentVariable(
@@ -315,7 +403,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Enable debug mode",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="general"
             ),
             "TESTING": EnvironmentVariable(
@@ -323,7 +411,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Enable testing mode",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="general"
             ),
             
@@ -333,7 +421,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Use mock services for testing",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="testing"
             ),
             "MOCK_LLM_RESPONSES": EnvironmentVariable(
@@ -341,7 +429,7 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Use mock LLM responses",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="testing"
             ),
             "MOCK_EMBEDDING_RESPONSES": EnvironmentVariable(
@@ -349,16 +437,18 @@ class EnvironmentValidator:
                 required=False,
                 default_value="false",
                 description="Use mock embedding responses",
-                validation_function=self._validate_boolean,
+                validation_function=cls._validate_boolean,
                 group="testing"
             ),
         }
     
-    def _validate_boolean(self, value: str) -> bool:
+    @staticmethod
+    def _validate_boolean(value: str) -> bool:
         """Validate boolean values"""
-        return value.lower() in ("true", "false", "1", "0", "yes", "no")
+        return value.lower() in _BOOL_VALUES
     
-    def _validate_port(self, value: str) -> bool:
+    @staticmethod
+    def _validate_port(value: str) -> bool:
         """Validate port numbers"""
         try:
             port = int(value)
@@ -366,7 +456,8 @@ class EnvironmentValidator:
         except ValueError:
             return False
     
-    def _validate_integer(self, value: str) -> bool:
+    @staticmethod
+    def _validate_integer(value: str) -> bool:
         """Validate integer values"""
         try:
             int(value)
@@ -374,25 +465,34 @@ class EnvironmentValidator:
         except ValueError:
             return False
     
-    def _validate_positive_integer(self, value: str) -> bool:
+    @staticmethod
+    def _validate_positive_integer(value: str) -> bool:
         """Validate positive integer values"""
         try:
             return int(value) > 0
         except ValueError:
             return False
     
-    def _validate_log_level(self, value: str) -> bool:
+    @staticmethod
+    def _validate_log_level(value: str) -> bool:
         """Validate log level values"""
-        return value.upper() in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+        return value.upper() in _LOG_LEVELS
     
-    def _validate_environment(self, value: str) -> bool:
+    @staticmethod
+    def _validate_environment(value: str) -> bool:
         """Validate environment values"""
-        return value.lower() in ("development", "staging", "production", "testing")
+        return value.lower() in _ENVIRONMENTS
     
-    def validate_single_variable(self, var_def: EnvironmentVariable) -> List[ValidationResult]:
-        """Validate a single environment variable"""
+    def validate_single_variable(self, var_def: EnvironmentVariable, env: Optional[Mapping[str, str]] = None) -> List[ValidationResult]:
+        """
+        Validate a single environment variable
+        
+        Args:
+            var_def: Variable definition to validate
+            env: Environment snapshot to read from (defaults to os.environ)
+        """
         results = []
-        value = os.getenv(var_def.name)
+        value = (os.environ if env is None else env).get(var_def.name)
         
         # Check if required variable is missing
         if var_def.required and not value:
@@ -418,24 +518,14 @@ class EnvironmentValidator:
         if not value and not var_def.required:
             return results
         
-        # Validate pattern if provided
-        if var_def.validation_pattern and value:
-            if not re.match(var_def.validation_pattern, value):
-                results.append(ValidationResult(
-                    level=ValidationLevel.ERROR,
-                    variable=var_def.name,
-                    message=f"Invalid format for '{var_def.name}': {value}",
-                    suggestion=f"Value should match pattern: {var_def.validation_pattern}"
-                ))
-        
-        # Validate using custom function if provided
-        if var_def.validation_function and value:
-            if not var_def.validation_function(value):
+        # Validate against the pattern and the custom function, whichever are defined
+        for check, message, suggestion in var_def._checks:
+            if not check(value):
                 results.append(ValidationResult(
                     level=ValidationLevel.ERROR,
                     variable=var_def.name,
-                    message=f"Invalid value for '{var_def.name}': {value}",
-                    suggestion=f"Check the format and valid values for {var_def.name}"
+                    message=f"{message}: {value}",
+                    suggestion=suggestion
                 ))
         
         return results
@@ -443,31 +533,39 @@ class EnvironmentValidator:
     def validate_all(self) -> List[ValidationResult]:
         """Validate all environment variables"""
         self.results.clear()
+        self._error_count = 0
+        # One snapshot for the whole run, so every variable is checked against the same environment
+        env = os.environ.copy()
         
-        for var_def in self.variables.values():
-            self.results.extend(self.validate_single_variable(var_def))
+        for var_def in self._validation_order:
+            var_results = self.validate_single_variable(var_def, env)
+            self._error_count += sum(r.level is ValidationLevel.ERROR for r in var_results)
+            self.results.extend(var_results)
         
         return self.results
     
     def validate_group(self, group: str) -> List[ValidationResult]:
         """Validate environment variables in a specific group"""
         results = []
+        env = os.environ.copy()
         
-        for var_def in self.variables.values():
-            if var_def.group == group:
-                results.extend(self.validate_single_variable(var_def))
+        for var_def in self._by_group.get(group, ()):
+            results.extend(self.validate_single_variable(var_def, env))
         
         return results
     
     def get_validation_summary(self) -> Dict[str, int]:
         """Get summary of validation results"""
-        summary = {
+        return self._build_summary(Counter(r.level for r in self.results))
+    
+    def _build_summary(self, counts: Mapping[ValidationLevel, int]) -> Dict[str, int]:
+        """Summary dict from per-level result counts"""
+        return {
             "total": len(self.results),
-            "errors": len([r for r in self.results if r.level == ValidationLevel.ERROR]),
-            "warnings": len([r for r in self.results if r.level == ValidationLevel.WARNING]),
-            "info": len([r for r in self.results if r.level == ValidationLevel.INFO])
+            "errors": counts.get(ValidationLevel.ERROR, 0),
+            "warnings": counts.get(ValidationLevel.WARNING, 0),
+            "info": counts.get(ValidationLevel.INFO, 0)
         }
-        return summary
     
     def print_results(self, show_info: bool = True) -> None:
         """Print validation results in a formatted way"""
@@ -475,104 +573,97 @@ class EnvironmentValidator:
             print("✅ All environment variables are valid!")
             return
         
-        # Group results by level
-        errors = [r for r in self.results if r.level == ValidationLevel.ERROR]
-        warnings = [r for r in self.results if r.level == ValidationLevel.WARNING]
-        info = [r for r in self.results if r.level == ValidationLevel.INFO]
-        
-        # Print errors
-        if errors:
-            print("❌ ERRORS:")
-            for result in errors:
-                print(f"  • {result.variable}: {result.message}")
-                if result.suggestion:
-                    print(f"    💡 {result.suggestion}")
-            print()
+        # Group results by level in one pass
+        buckets: Dict[ValidationLevel, List[ValidationResult]] = {level: [] for level in ValidationLevel}
+        for result in self.results:
+            buckets[result.level].append(result)
         
-        # Print warnings
-        if warnings:
-            print("⚠️  WARNINGS:")
-            for result in warnings:
-                print(f"  • {result.variable}: {result.message}")
-                if result.suggestion:
-                    print(f"    💡 {result.suggestion}")
-            print()
-        
-        # Print info messages
-        if info and show_info:
-            print("ℹ️  INFO:")
-            for result in info:
-                print(f"  • {result.variable}: {result.message}")
-                if result.suggestion:
-                    print(f"    💡 {result.suggestion}")
-            print()
+        # Errors, then warnings, then info messages, written to stdout at once
+        sections = [
+            ("❌ ERRORS:", buckets[ValidationLevel.ERROR]),
+            ("⚠️  WARNINGS:", buckets[ValidationLevel.WARNING]),
+            ("ℹ️  INFO:", buckets[ValidationLevel.INFO] if show_info else []),
+        ]
+        out: List[str] = []
+        for header, level_results in sections:
+            if level_results:
+                out.append(header)
+                for result in level_results:
+                    out.append(f"  • {result.variable}: {result.message}")
+                    if result.suggestion:
+                        out.append(f"    💡 {result.suggestion}")
+                out.append("")
         
-        # Print summary
-        summary = self.get_validation_summary()
-        print(f"📊 Summary: {summary['total']} total, {summary['errors']} errors, {summary['warnings']} warnings, {summary['info']} info")
+        # Summary
+        summary = self._build_summary({level: len(items) for level, items in buckets.items()})
+        out.append(f"📊 Summary: {summary['total']} total, {summary['errors']} errors, {summary['warnings']} warnings, {summary['info']} info")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def has_errors(self) -> bool:
         """Check if there are any validation errors"""
-        return any(r.level == ValidationLevel.ERROR for r in self.results)
+        return self._error_count > 0
     
-    def get_missing_required_variables(self) -> List[str]:
+    def get_missing_required_variables(self, env: Optional[Mapping[str, str]] = None) -> List[str]:
         """Get list of missing required variables"""
+        env = os.environ if env is None else env
         missing = []
         for var_def in self.variables.values():
-            if var_def.required and not os.getenv(var_def.name):
+            if var_def.required and not env.get(var_def.name):
                 missing.append(var_def.name)
         return missing
     
     def get_groups(self) -> List[str]:
         """Get list of all variable groups"""
-        return list(set(var_def.group for var_def in self.variables.values()))
+        return list(self._by_group)
     
     def test_configuration_scenarios(self) -> Dict[str, bool]:
         """Test various configuration scenarios"""
+        env = os.environ.copy()
         scenarios = {
-            "minimal_azure_openai": self._test_minimal_azure_openai(),
-            "full_azure_openai": self._test_full_azure_openai(),
-            "openai_fallback": self._test_openai_fallback(),
-            "development_mode": self._test_development_mode(),
-            "production_mode": self._test_production_mode(),
-            "testing_mode": self._test_testing_mode(),
+            "minimal_azure_openai": self._test_minimal_azure_openai(env),
+            "full_azure_openai": self._test_full_azure_openai(env),
+            "openai_fallback": self._test_openai_fallback(env),
+            "development_mode": self._test_development_mode(env),
+            "production_mode": self._test_production_mode(env),
+            "testing_mode": self._test_testing_mode(env),
         }
         return scenarios
     
-    def _test_minimal_azure_openai(self) -> bool:
+    def _test_minimal_azure_openai(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test minimal Azure OpenAI configuration"""
-        required_vars = [
-            "AZURE_OPENAI_API_KEY",
-            "AZURE_OPENAI_BASE_URL",
-            "AZURE_OPENAI_CHAT_DEPLOYMENT",
-            "AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT",
-        ]
-        return all(os.getenv(var) for var in required_vars)
+        env = os.environ if env is None else env
+        return all(env.get(var) for var in _MINIMAL_AZURE_VARS)
     
-    def _test_full_azure_openai(self) -> bool:
+    def _test_full_azure_openai(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test full Azure OpenAI configuration with all optional variables"""
-        return self._test_minimal_azure_openai() and all(
-            os.getenv(var) for var in [
-                "AZURE_OPENAI_API_VERSION",
-            ]
-        )
+        env = os.environ if env is None else env
+        return self._test_minimal_azure_openai(env) and all(env.get(var) for var in _FULL_AZURE_EXTRA)
     
-    def _test_openai_fallback(self) -> bool:
+    def _test_openai_fallback(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test OpenAI fallback configuration"""
-        return bool(os.getenv("OPENAI_API_KEY"))
+        env = os.environ if env is None else env
+        return bool(env.get("OPENAI_API_KEY"))
     
-    def _test_development_mode(self) -> bool:
+    def _test_development_mode(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test development mode configuration"""
-        return os.getenv("ENVIRONMENT", "development") == "development"
+        env = os.environ if env is None else env
+        return env.get("ENVIRONMENT", "development") == "development"
     
-    def _test_production_mode(self) -> bool:
+    def _test_production_mode(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test production mode configuration"""
-        env = os.getenv("ENVIRONMENT", "development")
-        return env == "production" and not os.getenv("DEBUG", "false").lower() == "true"
+        env = os.environ if env is None else env
+        environment = env.get("ENVIRONMENT", "development")
+        return environment == "production" and not env.get("DEBUG", "false").lower() == "true"
     
-    def _test_testing_mode(self) -> bool:
+    def _test_testing_mode(self, env: Optional[Mapping[str, str]] = None) -> bool:
         """Test testing mode configuration"""
-        return os.getenv("TESTING", "false").lower() == "true"
+        env = os.environ if env is None else env
+        return env.get("TESTING", "false").lower() == "true"
+
+
+# Variable definitions (with their compiled patterns) built once on import and shared read-only by every validator
+_VARIABLES: Mapping[str, EnvironmentVariable] = MappingProxyType(EnvironmentValidator._define_variables())
+_VALIDATION_ORDER: List[EnvironmentVariable] = _resolve_validation_order(_VARIABLES)
 
 
 def validate_environment_variables(show_info: bool = True) -> bool:
@@ -9,7 +9,7 @@ class ChatHistoryProvider(ABC):
         pass
 
     @abstractmethod
-    def get_messages(self, client_id=None, project_id=None, session_id=None, user_id=None, limit=None):
+    def get_messages(self, client_id=None, project_id=None, session_id=None, user_id=None, limit=None, offset=None):
         pass
 
     @abstractmethod
@@ -54,7 +54,7 @@ class PgSQLProvider(ChatHistoryProvider):
         return message_id
 
   
-    def get_messages(self, client_id=None, project_id=None, session_id=None, user_id=None, limit=None):
+    def get_messages(self, client_id=None, project_id=None, session_id=None, user_id=None, limit=None, offset=None):
         query = (
             """
             SELECT message_id, client_id, project_id, session_id, user_id, role, content, "references", created_at
@@ -86,6 +86,10 @@ class PgSQLProvider(ChatHistoryProvider):
             query += "\nLIMIT %s"
             params.append(limit)
 
+        if offset is not None:
+            query += "\nOFFSET %s"
+            params.append(offset)
+
         query += ";"
 
         with self._get_connection() as conn, conn.cursor() as cur: